@@ -26,20 +26,16 @@ import argparse
 import logging
 import sys
 from pathlib import Path
-from typing import List, cast
+from typing import TYPE_CHECKING, List, cast
 
 from dotenv import load_dotenv
-from state import TranslationState
 
-# ---------------------------------------------------------------------------
-# Local imports – these modules live in the repo
-# ---------------------------------------------------------------------------
-from nodes.extract_style import extract_style_guide_unified
-from nodes.extract_glossary import extract_glossary
-from graph import create_translator
-from langgraph.checkpoint.memory import InMemorySaver
-from langgraph.types import Command
-import csv
+if TYPE_CHECKING:
+    from state import TranslationState
+
+# Local imports of the graph and extraction nodes (which pull in LangGraph,
+# LangChain and rapidfuzz) are deferred to the sub-command that needs them, so
+# ``--help`` and argument errors return without loading them.
 import json
 import uuid
 
@@ -92,6 +88,10 @@ def _add_translate_parser(subparsers: argparse._SubParsersAction) -> argparse.Ar
 
 def _run_translation(args: argparse.Namespace) -> None:  # noqa: C901 – complexity comes from exhaustive error handling
     """Re-implementation of the old *main.py* logic but parameterised."""
+    from graph import create_translator
+    from langgraph.checkpoint.memory import InMemorySaver
+    from langgraph.types import Command
+    from nodes.utils import load_glossary_csv
 
     load_dotenv()
     _setup_logging()
@@ -124,24 +124,8 @@ def _run_translation(args: argparse.Namespace) -> None:  # noqa: C901 – comple
     # ------------------------------------------------------------------
     # Load glossary (CSV) – supports headerless fallback
     # ------------------------------------------------------------------
-    glossary: dict[str, str] = {}
     try:
-        with Path(args.glossary).open("r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            if reader.fieldnames and "term" in reader.fieldnames and "translation" in reader.fieldnames:
-                for row in reader:
-                    if row.get("term") and row.get("translation"):
-                        glossary[row["term"]] = row["translation"]
-                logger.info("Loaded glossary with headers → %s", args.glossary)
-            else:
-                f.seek(0)
-                reader2 = csv.reader(f)
-                for row_num, row in enumerate(reader2, 1):
-                    if len(row) >= 2 and row[0] and row[1]:
-                        glossary[row[0]] = row[1]
-                    elif len(row) < 2:
-                        logger.warning("Skipping glossary row %d – insufficient columns", row_num)
-                logger.info("Loaded headerless glossary → %s", args.glossary)
+        glossary = load_glossary_csv(args.glossary)
     except FileNotFoundError:
         logger.error("Glossary file not found: %s", args.glossary)
         sys.exit(1)
@@ -286,10 +270,14 @@ def _add_style_parser(subparsers: argparse._SubParsersAction) -> argparse.Argume
     p.add_argument("-tl", "--target-language", 
                    help="Target language code (required for TMX files)")
     p.add_argument("-o", "--output", required=True, help="Output markdown file path")
+    p.add_argument("--no-cache", action="store_true",
+                   help="Regenerate the style guide instead of reusing a cached one (TMX only)")
     return p
 
 
 def _run_extract_style(args: argparse.Namespace) -> None:
+    from nodes.extract_style import extract_style_guide_unified
+
     load_dotenv()
     _setup_logging()
 
@@ -305,6 +293,7 @@ def _run_extract_style(args: argparse.Namespace) -> None:
             source_language=args.source_language,
             target_language=args.target_language,
             output_path=args.output,
+            use_cache=not args.no_cache,
         )
         print(f"Style guide written to {args.output}")
     except Exception as e:
@@ -332,6 +321,8 @@ def _add_glossary_parser(subparsers: argparse._SubParsersAction) -> argparse.Arg
 
 
 def _run_extract_glossary(args: argparse.Namespace) -> None:
+    from nodes.extract_glossary import extract_glossary
+
     load_dotenv()
     _setup_logging()
 
@@ -13,6 +13,8 @@
 # in isolation.
 # ---------------------------------------------------------------------------
 
+from functools import lru_cache
+
 from langgraph.graph import StateGraph, END
 from state import TranslationState
 from nodes.filter_glossary import filter_glossary
@@ -21,14 +23,12 @@ from nodes.human_review import human_review
 from nodes.review_agent import review_translation_multi_agent, create_review_agent
 from langgraph.checkpoint.base import BaseCheckpointSaver
 
-def create_translator(checkpointer: BaseCheckpointSaver, include_review: bool = False, include_tmx: bool = False):
-    """
-    Creates and compiles the translation LangGraph.
-    
-    Args:
-        checkpointer: The checkpoint saver for state persistence
-        include_review: Whether to include the translation review node
-        include_tmx: Whether TMX functionality is enabled (affects review workflow)
+@lru_cache(maxsize=4)
+def _build_translator_graph(include_review: bool, include_tmx: bool) -> StateGraph:
+    """Build the uncompiled translation graph for one CLI option combination.
+
+    The builder is cached per ``(include_review, include_tmx)`` so repeated
+    runs only pay for ``compile``; the checkpointer stays per-run.
     """
     graph = StateGraph(TranslationState)
 
@@ -54,6 +54,18 @@ def create_translator(checkpointer: BaseCheckpointSaver, include_review: bool =
     else:
         graph.add_edge("translator", END)
 
+    return graph
+
+def create_translator(checkpointer: BaseCheckpointSaver, include_review: bool = False, include_tmx: bool = False):
+    """
+    Creates and compiles the translation LangGraph.
+    
+    Args:
+        checkpointer: The checkpoint saver for state persistence
+        include_review: Whether to include the translation review node
+        include_tmx: Whether TMX functionality is enabled (affects review workflow)
+    """
+    graph = _build_translator_graph(bool(include_review), bool(include_tmx))
     return graph.compile(checkpointer=checkpointer)
 
 def export_graph_png(output_path: str = "translator_graph.png", include_review: bool = False) -> str:
@@ -1,11 +1,7 @@
-import csv
 import json
 import logging
 import argparse
 from dotenv import load_dotenv
-from graph import create_translator
-from langgraph.checkpoint.memory import InMemorySaver
-from langgraph.types import Command
 import uuid
 
 def setup_logging():
@@ -85,6 +81,12 @@ def main():
     )
     args = parser.parse_args()
 
+    # Deferred until the arguments are valid, so --help does not load LangGraph/LangChain
+    from graph import create_translator
+    from langgraph.checkpoint.memory import InMemorySaver
+    from langgraph.types import Command
+    from nodes.utils import load_glossary_csv
+
     # Handle backward compatibility
     target_language = args.target_language
     if args.language:
@@ -110,32 +112,8 @@ def main():
         logger.error(f"Error reading input file: {e}")
         return
 
-    glossary = {}
     try:
-        with open(args.glossary, "r", encoding="utf-8", newline="") as f:
-            # First, try to read with headers
-            reader = csv.DictReader(f)
-            fieldnames = reader.fieldnames
-            
-            # Check if the CSV has proper headers (term, translation)
-            if fieldnames and "term" in fieldnames and "translation" in fieldnames:
-                # CSV has proper headers
-                for row in reader:
-                    if row["term"] and row["translation"]:  # Skip empty rows
-                        glossary[row["term"]] = row["translation"]
-                logger.info(f"Loaded glossary with headers from {args.glossary}")
-            else:
-                # CSV doesn't have proper headers, treat as headerless
-                # Reset file pointer to beginning
-                f.seek(0)
-                reader = csv.reader(f)
-                for row_num, row in enumerate(reader, 1):
-                    if len(row) >= 2 and row[0] and row[1]:  # Ensure we have at least 2 columns and they're not empty
-                        glossary[row[0]] = row[1]  # First column = term, second = translation
-                    elif len(row) < 2:
-                        logger.warning(f"Skipping row {row_num} in glossary: insufficient columns")
-                logger.info(f"Loaded headerless glossary from {args.glossary} (assuming first column=term, second=translation)")
-                
+        glossary = load_glossary_csv(args.glossary)
     except FileNotFoundError:
         logger.error(f"Glossary file not found: {args.glossary}")
         return
@@ -240,49 +218,51 @@ def main():
     # At this point, result should contain the final state
     final_state = result
     
-    # 3. Print results
-    print("\n--- Original Content ---")
-    print(original_content)
-    print(f"\n--- Translated Content ({args.source_language} → {target_language}) ---")
-    print(final_state.get("translated_content"))
+    # 3. Print results (collected and written in one go)
+    lines = [
+        "\n--- Original Content ---",
+        original_content,
+        f"\n--- Translated Content ({args.source_language} → {target_language}) ---",
+        str(final_state.get("translated_content")),
+    ]
     
     # Print review results if enabled
     if args.review and final_state.get("review_score") is not None:
-        print(f"\n--- Translation Review ---")
+        lines.append(f"\n--- Translation Review ---")
         score = final_state.get("review_score")
         explanation = final_state.get("review_explanation", "")
         
-        print(f"Overall Review Score: {score:.2f} (on scale from -1.0 to 1.0)")
+        lines.append(f"Overall Review Score: {score:.2f} (on scale from -1.0 to 1.0)")
         
         if score >= 0.7:
-            print("Quality Assessment: Good to Excellent")
+            lines.append("Quality Assessment: Good to Excellent")
         elif score >= 0.3:
-            print("Quality Assessment: Acceptable")
+            lines.append("Quality Assessment: Acceptable")
         elif score >= 0.0:
-            print("Quality Assessment: Poor - Needs Improvement")
+            lines.append("Quality Assessment: Poor - Needs Improvement")
         else:
-            print("Quality Assessment: Very Poor - Major Revision Required")
+            lines.append("Quality Assessment: Very Poor - Major Revision Required")
         
         # Show detailed breakdown from multi-agent review
-        print(f"\n--- Detailed Score Breakdown ---")
+        lines.append(f"\n--- Detailed Score Breakdown ---")
         glossary_score = final_state.get("glossary_faithfulness_score")
         grammar_score = final_state.get("grammar_correctness_score")
         style_score = final_state.get("style_adherence_score")
         tmx_score = final_state.get("tmx_faithfulness_score")
         
         if glossary_score is not None:
-            print(f"Glossary Faithfulness: {glossary_score:.2f}")
+            lines.append(f"Glossary Faithfulness: {glossary_score:.2f}")
         if grammar_score is not None:
-            print(f"Grammar Correctness: {grammar_score:.2f}")
+            lines.append(f"Grammar Correctness: {grammar_score:.2f}")
         if style_score is not None:
-            print(f"Style Adherence: {style_score:.2f}")
+            lines.append(f"Style Adherence: {style_score:.2f}")
         if tmx_score is not None:
-            print(f"TMX Faithfulness: {tmx_score:.2f}")
+            lines.append(f"TMX Faithfulness: {tmx_score:.2f}")
         
         if explanation:
-            print(f"\nReview Explanation: {explanation}")
+            lines.append(f"\nReview Explanation: {explanation}")
         else:
-            print("\nReview Explanation: None needed (score is sufficiently high)")
+            lines.append("\nReview Explanation: None needed (score is sufficiently high)")
         
         # Show individual dimension explanations if available
         dimension_explanations = [
@@ -294,9 +274,10 @@ def main():
         
         individual_issues = [f"{dim}: {expl}" for dim, expl in dimension_explanations if expl]
         if individual_issues:
-            print(f"\nDetailed Issues:")
-            for issue in individual_issues:
-                print(f"  - {issue}")
+            lines.append(f"\nDetailed Issues:")
+            lines.extend(f"  - {issue}" for issue in individual_issues)
+
+    print("\n".join(lines))
 
     # Generate visualizations if requested
     if args.visualize or (args.review and args.viz_type != "main"):
@@ -7,34 +7,56 @@ sentences for further processing.
 """
 
 import logging
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 import re
 
-try:
-    import pypdf
-except ImportError:
-    pypdf = None
+logger = logging.getLogger(__name__)
 
-try:
-    from docx import Document
-except ImportError:
-    Document = None
 
-try:
-    import nltk
-    from nltk.tokenize import sent_tokenize
-except ImportError:
-    nltk = None
-    sent_tokenize = None
+# Optional dependencies are imported on first use so that loading this module
+# (e.g. for ``--help`` or TMX-only workflows) does not pay for pypdf,
+# python-docx and NLTK.
+@lru_cache(maxsize=None)
+def _get_pypdf():
+    """Return the :mod:`pypdf` module, importing it on first use."""
+    try:
+        import pypdf
+    except ImportError:
+        raise ImportError("pypdf is required for PDF parsing. Install with: pip install pypdf")
+    return pypdf
 
-logger = logging.getLogger(__name__)
+
+@lru_cache(maxsize=None)
+def _get_document_class():
+    """Return ``docx.Document``, importing python-docx on first use."""
+    try:
+        from docx import Document
+    except ImportError:
+        raise ImportError("python-docx is required for DOCX parsing. Install with: pip install python-docx")
+    return Document
+
+
+@lru_cache(maxsize=None)
+def _get_nltk():
+    """Return the :mod:`nltk` package, importing it on first use."""
+    try:
+        import nltk
+        import nltk.tokenize  # noqa: F401 – make ``nltk.tokenize`` available
+    except ImportError:
+        raise ImportError("NLTK is required for sentence tokenization. Install with: pip install nltk")
+    return nltk
+
+
+def sent_tokenize(text: str, language: str = "english") -> List[str]:
+    """Defer to NLTK's ``sent_tokenize`` without importing NLTK at module load."""
+    return _get_nltk().tokenize.sent_tokenize(text, language=language)
 
 
 def _ensure_nltk_data():
     """Ensure NLTK punkt tokenizer is available."""
-    if nltk is None:
-        raise ImportError("NLTK is required for sentence tokenization. Install with: pip install nltk")
+    nltk = _get_nltk()
     
     # Try to find the tokenizer data, handling both old and new NLTK versions
     try:
@@ -54,14 +76,26 @@ def _ensure_nltk_data():
                 nltk.download('punkt', quiet=True)
 
 
+@lru_cache(maxsize=None)
+def _ensure_nltk_data_once() -> None:
+    """Run :func:`_ensure_nltk_data` once per process.
+
+    The data lookup scans every NLTK search path, so it is only worth doing
+    for the first document. A failed check is not cached and is retried.
+    """
+    _ensure_nltk_data()
+
+
+# A sentence runs up to a punctuation run followed by whitespace (or the end
+# of the text); the terminating punctuation is not part of the capture.
+_SENTENCE_RE = re.compile(r'(.*?)(?:[.!?]+(?:\s+|$)|$)', re.DOTALL)
+
+
 def _basic_sentence_split(text: str) -> List[str]:
     """Basic sentence splitting fallback when NLTK is not available."""
-    # Simple regex-based sentence splitting
-    sentences = re.split(r'[.!?]+\s+', text)
-    # Remove any trailing punctuation from the last sentence
-    if sentences and sentences[-1]:
-        sentences[-1] = re.sub(r'[.!?]+$', '', sentences[-1])
-    return [s.strip() for s in sentences if s.strip()]
+    # Single regex pass that also drops the trailing punctuation
+    sentences = (m.group(1).strip() for m in _SENTENCE_RE.finditer(text))
+    return [s for s in sentences if s]
 
 
 def split_into_sentences(text: str, language: str = "english") -> List[str]:
@@ -77,10 +111,14 @@ def split_into_sentences(text: str, language: str = "english") -> List[str]:
     if not text.strip():
         return []
     
-    # Try NLTK first
-    if sent_tokenize is not None:
+    # Try NLTK first, if it is installed
+    try:
+        _get_nltk()
+    except ImportError:
+        logger.debug("NLTK is not installed. Using basic sentence splitting.")
+    else:
         try:
-            _ensure_nltk_data()
+            _ensure_nltk_data_once()
             sentences = sent_tokenize(text, language=language)
             return [s.strip() for s in sentences if s.strip()]
         except Exception as e:
@@ -105,8 +143,7 @@ def parse_pdf(file_path: str, language: str = "english") -> List[str]:
         FileNotFoundError: If the PDF file doesn't exist
         ValueError: If the PDF cannot be parsed
     """
-    if pypdf is None:
-        raise ImportError("pypdf is required for PDF parsing. Install with: pip install pypdf")
+    pypdf = _get_pypdf()
     
     pdf_path = Path(file_path)
     if not pdf_path.exists():
@@ -114,7 +151,7 @@ def parse_pdf(file_path: str, language: str = "english") -> List[str]:
     
     logger.info(f"Parsing PDF file: {file_path}")
     
-    text_content = ""
+    chunks: List[str] = []
     try:
         with open(pdf_path, 'rb') as file:
             pdf_reader = pypdf.PdfReader(file)
@@ -122,8 +159,11 @@ def parse_pdf(file_path: str, language: str = "english") -> List[str]:
             for page_num, page in enumerate(pdf_reader.pages):
                 try:
                     page_text = page.extract_text()
+                    # Collapse whitespace per page so the text is only walked
+                    # once before sentence splitting.
+                    page_text = " ".join((page_text or "").split())
                     if page_text:
-                        text_content += page_text + "\n"
+                        chunks.append(page_text)
                 except Exception as e:
                     logger.warning(f"Failed to extract text from page {page_num + 1}: {e}")
                     continue
@@ -131,15 +171,11 @@ def parse_pdf(file_path: str, language: str = "english") -> List[str]:
     except Exception as e:
         raise ValueError(f"Failed to parse PDF file {file_path}: {e}")
     
-    if not text_content.strip():
+    if not chunks:
         raise ValueError(f"No text content found in PDF file: {file_path}")
     
-    # Clean up the text
-    text_content = re.sub(r'\s+', ' ', text_content)  # Normalize whitespace
-    text_content = text_content.strip()
-    
     # Split into sentences
-    sentences = split_into_sentences(text_content, language)
+    sentences = split_into_sentences(" ".join(chunks), language)
     
     logger.info(f"Extracted {len(sentences)} sentences from PDF")
     return sentences
@@ -160,8 +196,7 @@ def parse_docx(file_path: str, language: str = "english") -> List[str]:
         FileNotFoundError: If the DOCX file doesn't exist
         ValueError: If the DOCX cannot be parsed
     """
-    if Document is None:
-        raise ImportError("python-docx is required for DOCX parsing. Install with: pip install python-docx")
+    Document = _get_document_class()
     
     docx_path = Path(file_path)
     if not docx_path.exists():
@@ -169,35 +204,32 @@ def parse_docx(file_path: str, language: str = "english") -> List[str]:
     
     logger.info(f"Parsing DOCX file: {file_path}")
     
-    text_content = ""
+    chunks: List[str] = []
     try:
         doc = Document(docx_path)
         
-        # Extract text from paragraphs
+        # Extract text from paragraphs, collapsing whitespace as we go
         for paragraph in doc.paragraphs:
-            if paragraph.text.strip():
-                text_content += paragraph.text + "\n"
+            paragraph_text = " ".join(paragraph.text.split())
+            if paragraph_text:
+                chunks.append(paragraph_text)
         
         # Extract text from tables
         for table in doc.tables:
             for row in table.rows:
                 for cell in row.cells:
-                    if cell.text.strip():
-                        text_content += cell.text + " "
-            text_content += "\n"
+                    cell_text = " ".join(cell.text.split())
+                    if cell_text:
+                        chunks.append(cell_text)
     
     except Exception as e:
         raise ValueError(f"Failed to parse DOCX file {file_path}: {e}")
     
-    if not text_content.strip():
+    if not chunks:
         raise ValueError(f"No text content found in DOCX file: {file_path}")
     
-    # Clean up the text
-    text_content = re.sub(r'\s+', ' ', text_content)  # Normalize whitespace
-    text_content = text_content.strip()
-    
     # Split into sentences
-    sentences = split_into_sentences(text_content, language)
+    sentences = split_into_sentences(" ".join(chunks), language)
     
     logger.info(f"Extracted {len(sentences)} sentences from DOCX")
     return sentences
@@ -1,11 +1,12 @@
 import csv
+import io
 import logging
 import re
 from collections import Counter
 from pathlib import Path
-from typing import List, Tuple, Set, Optional
+from typing import Iterator, List, Tuple, Set, Optional
 
-from nodes.tmx_loader import parse_tmx_file
+from nodes.tmx_loader import canonical_indexes, canonical_language, parse_tmx_file
 
 logger = logging.getLogger(__name__)
 
@@ -58,10 +59,6 @@ STOPWORDS: Set[str] = {
 # Helpers
 # ---------------------------------------------------------------------------
 
-def _canonical(code: str) -> str:
-    return code.lower().split("-")[0].split("_")[0]
-
-
 def _tokenise(text: str) -> List[str]:
     """A naive tokenizer that keeps diacritics and apostrophes."""
     return re.findall(r"[A-Za-zÀ-ÿ\u00f1\u00d1'-]+", text)
@@ -73,28 +70,23 @@ def _tokenise(text: str) -> List[str]:
 
 def _collect_tmx_entries(
     tmx_data: dict, source_language: str, target_language: str
-) -> List[Tuple[str, str]]:
-    src_base = _canonical(source_language)
-    tgt_base = _canonical(target_language)
-    entries: List[Tuple[str, str]] = []
+) -> Iterator[Tuple[str, str]]:
+    src_base = canonical_language(source_language)
+    tgt_base = canonical_language(target_language)
 
     # 1) Exact key --------------------------------------------------------
     key = f"{src_base}->{tgt_base}"
+    found = False
     for entry in tmx_data.get(key, []):
-        entries.append((entry["source"], entry["target"]))
+        found = True
+        yield entry["source"], entry["target"]
 
     # 2) Fallback: aggregate over canonicalised pairs --------------------
-    if not entries:
-        for pair_key, pair_entries in tmx_data.items():
-            try:
-                src, tgt = pair_key.split("->", 1)
-            except ValueError:
-                continue
-            if _canonical(src) == src_base and _canonical(tgt) == tgt_base:
-                for entry in pair_entries:
-                    entries.append((entry["source"], entry["target"]))
-
-    return entries
+    if not found:
+        pair_index, _ = canonical_indexes(tmx_data)
+        yield from (
+            (entry["source"], entry["target"]) for entry in pair_index.get((src_base, tgt_base), [])
+        )
 
 
 def extract_glossary_from_tmx(
@@ -106,13 +98,15 @@ def extract_glossary_from_tmx(
 
     logger.info("Parsing TMX for glossary extraction → %s", tmx_path)
     tmx_data = parse_tmx_file(tmx_path)
-    pairs = _collect_tmx_entries(tmx_data, source_language, target_language)
 
     seen: Set[str] = set()
     glossary: List[Tuple[str, str]] = []
 
-    for src, tgt in pairs:
-        if 1 <= len(src.split()) <= max_len:
+    # Filter while iterating so the unfiltered pairs are never materialised.
+    for src, tgt in _collect_tmx_entries(tmx_data, source_language, target_language):
+        # Split at most ``max_len`` times: long segments stop after
+        # ``max_len + 1`` words instead of being split in full.
+        if 1 <= len(src.split(None, max_len)) <= max_len:
             key = src.lower()
             if key not in seen:
                 seen.add(key)
@@ -138,10 +132,13 @@ def extract_terms_from_text(text: str, top_n: int = 50) -> List[str]:
 
 def write_glossary_csv(rows: List[Tuple[str, str]], output_path: str):
     out_file = Path(output_path)
+    # Render the whole CSV in memory and hand it to the file in one write.
+    buf = io.StringIO()
+    writer = csv.writer(buf)
+    writer.writerow(["term", "translation"])
+    writer.writerows(rows)
     with out_file.open("w", encoding="utf-8", newline="") as f:
-        writer = csv.writer(f)
-        writer.writerow(["term", "translation"])
-        writer.writerows(rows)
+        f.write(buf.getvalue())
     logger.info("Glossary written → %s", out_file)
 
 
@@ -1,49 +1,38 @@
+import hashlib
 import logging
 from pathlib import Path
 from typing import List, Optional
 import os
 
-from nodes.tmx_loader import parse_tmx_file
-from nodes.style_guide import infer_style_guide_from_tmx
+from nodes.tmx_loader import canonical_indexes, canonical_language, parse_tmx_file
+from nodes.style_guide import STYLE_GUIDE_PROMPT, infer_style_guide_from_tmx
 from nodes.document_parsers import parse_document, create_document_entries
 
 logger = logging.getLogger(__name__)
 
 
-def _canonical(code: str) -> str:
-    """Return base ISO language code (strip region / script variants)."""
-    return code.lower().split("-")[0].split("_")[0]
-
-
 def _flatten_target_segments(tmx_data: dict, source_language: str, target_language: str) -> List[dict]:
     """Return a list of *target* text segments for the requested language pair.
 
     Falls back gracefully to any segments that match the canonicalised
     language codes if no exact pair is found.
     """
-    src_base = _canonical(source_language)
-    tgt_base = _canonical(target_language)
+    src_base = canonical_language(source_language)
+    tgt_base = canonical_language(target_language)
 
     # 1) Exact key first -------------------------------------------------
     key = f"{src_base}->{tgt_base}"
     entries = tmx_data.get(key, [])
 
-    # 2) Fallback: aggregate over keys whose canonicalised codes match ----
-    if not entries:
-        for pair_key, pair_entries in tmx_data.items():
-            try:
-                src, tgt = pair_key.split("->", 1)
-            except ValueError:
-                continue
-            if _canonical(src) == src_base and _canonical(tgt) == tgt_base:
-                entries.extend(pair_entries)
-
-    # 3) Final fallback: ANY entry where target matches the requested ----
     if not entries:
-        for pair_entries in tmx_data.values():
-            for entry in pair_entries:
-                if _canonical(entry.get("target_lang", "")) == tgt_base:
-                    entries.append(entry)
+        pair_index, target_index = canonical_indexes(tmx_data)
+
+        # 2) Fallback: aggregate over keys whose canonicalised codes match ----
+        entries = pair_index.get((src_base, tgt_base), [])
+
+        # 3) Final fallback: ANY entry where target matches the requested ----
+        if not entries:
+            entries = target_index.get(tgt_base, [])
 
     # Return the **full** entry dictionaries so that downstream consumers (e.g.
     # ``infer_style_guide_from_tmx``) have access to both *source* and *target*
@@ -111,11 +100,57 @@ def extract_style_guide_from_document(
     return style_guide_md
 
 
+# Generated TMX style guides are cached on disk, keyed by the TMX content
+# hash, the canonical language pair, whether the LLM produced the guide and
+# the generator version.  ``AI_TRANSLATOR_STYLE_CACHE_DIR`` overrides the
+# location.
+STYLE_CACHE_DIR = Path.home() / ".cache" / "ai-translator" / "style"
+STYLE_CACHE_DIR_ENV = "AI_TRANSLATOR_STYLE_CACHE_DIR"
+
+# Bump when the guide generation changes in a way the prompt hash below does
+# not capture (e.g. example selection), so stale guides are not reused.
+STYLE_CACHE_VERSION = 1
+_STYLE_PROMPT_DIGEST = hashlib.sha256(STYLE_GUIDE_PROMPT.encode("utf-8")).hexdigest()[:12]
+
+
+def _style_cache_dir() -> Path:
+    override = os.getenv(STYLE_CACHE_DIR_ENV)
+    return Path(override).expanduser() if override else STYLE_CACHE_DIR
+
+
+def _style_cache_path(tmx_file: Path, source_language: str, target_language: str) -> Path:
+    with tmx_file.open("rb") as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            digest = hashlib.file_digest(f, "sha256").hexdigest()
+        else:
+            hasher = hashlib.sha256()
+            for chunk in iter(lambda: f.read(1 << 20), b""):
+                hasher.update(chunk)
+            digest = hasher.hexdigest()
+    mode = "llm" if os.getenv("OPENAI_API_KEY") else "examples"
+    version = f"v{STYLE_CACHE_VERSION}-{_STYLE_PROMPT_DIGEST}"
+    return _style_cache_dir() / (
+        f"{digest}_{canonical_language(source_language)}_{canonical_language(target_language)}_{mode}_{version}.md"
+    )
+
+
+def _write_style_cache(cache_path: Path, style_guide_md: str) -> None:
+    """Atomically store a generated style guide; failures are only logged."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp_path = cache_path.with_name(f"{cache_path.name}.{os.getpid()}.tmp")
+        tmp_path.write_text(style_guide_md, encoding="utf-8")
+        os.replace(tmp_path, cache_path)
+    except OSError as exc:
+        logger.warning("Could not cache style guide → %s: %s", cache_path, exc)
+
+
 def extract_style_guide(
     tmx_path: str,
     source_language: str,
     target_language: str,
     output_path: str = "extracted_style.md",
+    use_cache: bool = True,
 ) -> str:
     """Generate a **comprehensive** style guide using TMX data.
 
@@ -135,23 +170,35 @@ def extract_style_guide(
     3. **Graceful Fallback** – When no API key is available (e.g. in CI) we
        fall back to a purely heuristic guide similar to the previous
        implementation, ensuring offline determinism for tests.
+
+    With ``use_cache`` (the default) the result is stored under
+    ``STYLE_CACHE_DIR`` (or ``$AI_TRANSLATOR_STYLE_CACHE_DIR``) and returned directly for an unchanged TMX file and
+    language pair, skipping both the TMX parse and the LLM call.
     """
     tmx_file = Path(tmx_path)
     if not tmx_file.exists():
         raise FileNotFoundError(f"TMX file not found: {tmx_path}")
 
-    logger.info("Parsing TMX file for style extraction → %s", tmx_file)
-    tmx_data = parse_tmx_file(str(tmx_file))
+    cache_path = _style_cache_path(tmx_file, source_language, target_language) if use_cache else None
+    if cache_path is not None and cache_path.exists():
+        logger.info("Using cached style guide ← %s", cache_path)
+        style_guide_md = cache_path.read_text(encoding="utf-8")
+    else:
+        logger.info("Parsing TMX file for style extraction → %s", tmx_file)
+        tmx_data = parse_tmx_file(str(tmx_file))
+
+        # Leverage the shared TMX inference utility which already supports LLM + fallback
+        tmx_memory = {
+            "entries": _flatten_target_segments(tmx_data, source_language, target_language),
+            "language_pair": f"{source_language}->{target_language}",
+        }
 
-    # Leverage the shared TMX inference utility which already supports LLM + fallback
-    tmx_memory = {
-        "entries": _flatten_target_segments(tmx_data, source_language, target_language),
-        "language_pair": f"{source_language}->{target_language}",
-    }
+        style_guide_md = infer_style_guide_from_tmx(tmx_memory, use_llm=True)
+        if not style_guide_md:
+            raise ValueError("Failed to generate style guide from TMX entries.")
 
-    style_guide_md = infer_style_guide_from_tmx(tmx_memory, use_llm=True)
-    if not style_guide_md:
-        raise ValueError("Failed to generate style guide from TMX entries.")
+        if cache_path is not None:
+            _write_style_cache(cache_path, style_guide_md)
 
     # Write out ----------------------------------------------------------
     out_path = Path(output_path)
@@ -167,6 +214,7 @@ def extract_style_guide_unified(
     source_language: str,
     target_language: Optional[str] = None,
     output_path: str = "extracted_style.md",
+    use_cache: bool = True,
 ) -> str:
     """Unified style guide extraction that handles both TMX and document files.
 
@@ -176,6 +224,8 @@ def extract_style_guide_unified(
         source_language: Source language
         target_language: Target language (required for TMX, optional for documents)
         output_path: Output path for the style guide
+        use_cache: Reuse / store the generated guide in the on-disk cache
+            (TMX files only; documents are always analysed afresh)
 
     Returns:
         The generated style guide as a markdown string
@@ -188,7 +238,7 @@ def extract_style_guide_unified(
     if file_type == 'tmx':
         if target_language is None:
             raise ValueError("Target language is required for TMX files")
-        return extract_style_guide(file_path, source_language, target_language, output_path)
+        return extract_style_guide(file_path, source_language, target_language, output_path, use_cache=use_cache)
     
     elif file_type in ['pdf', 'docx', 'doc']:
         # For document files, we use the source language as both source and target
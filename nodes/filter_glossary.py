@@ -1,6 +1,12 @@
 import logging
-from rapidfuzz import process, fuzz
+from functools import lru_cache
+from typing import Dict, Iterable, List, Set, Tuple
+from rapidfuzz import fuzz
 from state import TranslationState
+try:
+    import ahocorasick
+except ImportError:  # pragma: no cover
+    ahocorasick = None  # type: ignore
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -23,16 +29,63 @@ the source content we:
 
 Implementation details
 ----------------------
-We use `rapidfuzz.process.extract` with the `WRatio` scorer, which is a robust
-fuzzy-matching algorithm. A score cut-off of 75 has empirically been found to
-strike a good balance between catching slight variations (e.g. "colour" vs
-"color") while avoiding false positives.
+Terms are first matched verbatim (case-insensitively). Terms that are not
+found that way are scored with `rapidfuzz.fuzz.partial_ratio`, called directly
+rather than through `process.extractOne` since there is only one haystack. A
+score cut-off of 75 has empirically been found to strike a good balance
+between catching slight variations (e.g. "colour" vs "color") while avoiding
+false positives.
 
 The function returns a **partial** state update – exactly how LangGraph expects
 node outputs to be shaped. Upstream nodes will merge this dict into the global
 `TranslationState`.
 """
 
+@lru_cache(maxsize=16)
+def _build_term_matcher(glossary_terms: Tuple[str, ...], use_automaton: bool):
+    """Group a glossary's terms by lowercase form and compile their matcher.
+
+    Cached per glossary so that repeated runs (batch translation, review
+    loops) reuse the compiled automaton instead of rebuilding it.
+    """
+    # Several glossary keys may share the same lowercase form.
+    terms_by_lower: Dict[str, List[str]] = {}
+    for term in glossary_terms:
+        terms_by_lower.setdefault(term.lower(), []).append(term)
+
+    automaton = None
+    if use_automaton and any(terms_by_lower):
+        automaton = ahocorasick.Automaton()
+        for term_lower in terms_by_lower:
+            if term_lower:
+                automaton.add_word(term_lower, term_lower)
+        automaton.make_automaton()
+    return automaton, terms_by_lower
+
+
+def find_exact_terms(glossary_terms: Iterable[str], content_lower: str) -> Set[str]:
+    """Return the glossary terms that occur, case-insensitively, in the content.
+
+    With ``pyahocorasick`` installed all terms are matched in a single scan of
+    ``content_lower``; otherwise each term is searched for separately. The
+    compiled matcher is cached per term set and shared with the glossary
+    review node.
+    """
+    automaton, terms_by_lower = _build_term_matcher(tuple(glossary_terms), ahocorasick is not None)
+    if automaton is None:
+        return {
+            term
+            for term_lower, terms in terms_by_lower.items()
+            if term_lower in content_lower
+            for term in terms
+        }
+
+    found: Set[str] = set(terms_by_lower.get("", []))
+    for _, term_lower in automaton.iter(content_lower):
+        found.update(terms_by_lower[term_lower])
+    return found
+
+
 def filter_glossary(state: TranslationState) -> dict:
     """
     Filters the glossary to include only terms found in the original content.
@@ -58,63 +111,54 @@ def filter_glossary(state: TranslationState) -> dict:
     original_content = state["original_content"]
 
     # ``state["glossary"]`` maps *term* → *preferred translation*.
-    # We only need the keys for fuzzy matching.
-    glossary_terms = list(state["glossary"].keys())
+    glossary = state["glossary"]
     
-    # For each glossary term, check if it appears within the original content
-    # using fuzzy matching. We want to find terms that appear IN the content,
-    # not find which terms are similar TO the entire content.
+    # Check each term against the content directly: exact (case-insensitive)
+    # substring matches first, found for all terms in one scan, then a fuzzy
+    # match for multi-word terms that were not found verbatim.
     filtered_glossary = {}
-    
-    for term in glossary_terms:
-        # Use extractOne to find the best match of this term within the content
-        # This searches for the term within the content, not the other way around
-        match = process.extractOne(
-            term,
-            [original_content],
-            scorer=fuzz.partial_ratio,  # partial_ratio is better for finding substrings
-            score_cutoff=75,
-        )
-        
-        # If we found a good match, include this term in the filtered glossary
-        if match is not None:
-            filtered_glossary[term] = state["glossary"][term]
-            logger.debug(f"Found term '{term}' in content with score {match[1]}")
-    
-    # Alternative approach: check each term against the content more directly
-    # This approach tokenizes and uses word-level matching which can be more accurate
-    additional_terms = {}
+    single_word_terms = []
     content_lower = original_content.lower()
+    exact_terms = find_exact_terms(glossary, content_lower)
     
-    for term in glossary_terms:
-        term_lower = term.lower()
-        
+    for term, translation in glossary.items():
         # Direct substring match (most reliable)
-        if term_lower in content_lower:
-            additional_terms[term] = state["glossary"][term]
-            logger.debug(f"Found exact term '{term}' in content")
+        if term in exact_terms:
+            filtered_glossary[term] = translation
+            logger.debug("Found exact term '%s' in content", term)
         else:
             # Fuzzy match for individual words in the term
-            term_words = term_lower.split()
+            term_words = term.lower().split()
             if len(term_words) > 1:
                 # For multi-word terms, check if the words appear close together
                 term_pattern = ' '.join(term_words)
-                match = process.extractOne(
-                    term_pattern,
-                    [content_lower],
-                    scorer=fuzz.partial_ratio,
-                    score_cutoff=75,
-                )
-                if match is not None:
-                    additional_terms[term] = state["glossary"][term]
-                    logger.debug(f"Found multi-word term '{term}' in content with score {match[1]}")
+                score = fuzz.partial_ratio(term_pattern, content_lower, score_cutoff=75)
+                if score:
+                    filtered_glossary[term] = translation
+                    logger.debug("Found multi-word term '%s' in content with score %s", term, score)
+            else:
+                single_word_terms.append((term, translation))
     
-    # Merge both approaches - prefer the more accurate one
-    if additional_terms:
-        filtered_glossary = additional_terms
+    # Prefer the direct matches. Only when none were found do we fall back to
+    # fuzzy-matching against the whole content. Multi-word terms have already
+    # been scored against the lowercased content above, which can only score
+    # at least as high, so only the single-word terms are worth a second look.
+    if not filtered_glossary:
+        for term, translation in single_word_terms:
+            # Score the best alignment of this term within the content; this
+            # searches for the term within the content, not the other way around.
+            # partial_ratio is better for finding substrings, and the cutoff lets
+            # it bail out early on clearly unrelated terms.
+            score = fuzz.partial_ratio(term, original_content, score_cutoff=75)
+            
+            # If we found a good match, include this term in the filtered glossary
+            if score:
+                filtered_glossary[term] = translation
+                logger.debug("Found term '%s' in content with score %s", term, score)
 
     logger.info(f"Found {len(filtered_glossary)} relevant glossary terms.")
-    logger.debug(f"Filtered glossary: {filtered_glossary}")
+    # Lazy %-formatting: the (possibly large) dict repr is only built when DEBUG is on
+    logger.debug("Filtered glossary: %s", filtered_glossary)
 
     # Return the partial state update for LangGraph to merge.
-    return {"filtered_glossary": filtered_glossary} 
\ No newline at end of file
+    return {"filtered_glossary": filtered_glossary}
@@ -13,10 +13,11 @@ The multi-agent approach provides:
 - Better performance through specialized evaluation
 - Token efficiency with focused prompts
 - Modular testing and maintenance
-- Parallel evaluation potential
+- Parallel evaluation of the independent LLM dimensions
 """
 
 import logging
+from functools import lru_cache
 from langgraph.graph import StateGraph, END
 from langgraph.checkpoint.base import BaseCheckpointSaver
 from state import TranslationState
@@ -38,11 +39,19 @@ def create_review_agent(checkpointer: Optional[BaseCheckpointSaver] = None, incl
     between specialized evaluation nodes, allowing for efficient and
     focused assessment of translation quality.
     
+    Graph topology (without TMX; grammar and style run concurrently):
+    
+                            ↗ [grammar_correctness] ↘
+    [glossary_faithfulness]                           [aggregator] → END
+                            ↘ [style_adherence]     ↗
+    
     Graph topology (with TMX):
     
-    [glossary_faithfulness] → [tmx_faithfulness] → [grammar_correctness] → [style_adherence] → [aggregator] → END
-                           ↘                   ↘                      ↘
-                             [aggregator] ← [aggregator] ← [aggregator]
+    [glossary_faithfulness] → [tmx_faithfulness] → [style_adherence] → [aggregator] → END
+    
+    Either path skips straight to the aggregator when a score is very poor;
+    the TMX path also does so once the translation is verified to reproduce an
+    exact TMX match.
     
     Args:
         checkpointer: Optional checkpoint saver for state persistence
@@ -85,6 +94,17 @@ def create_review_agent(checkpointer: Optional[BaseCheckpointSaver] = None, incl
     return compiled_graph
 
 
+@lru_cache(maxsize=1)
+def _default_review_graph():
+    """Compile the checkpointer-less review graph once per process.
+
+    The topology does not depend on the state being reviewed, so the
+    compiled graph is shared by every review that does not bring its own
+    checkpointer (which is how the translation graph's review node calls it).
+    """
+    return create_review_agent()
+
+
 def review_translation_multi_agent(state: TranslationState, checkpointer: Optional[BaseCheckpointSaver] = None, include_tmx: bool = False) -> TranslationState:
     """
     Main function to review a translation using the multi-agent approach.
@@ -106,8 +126,11 @@ def review_translation_multi_agent(state: TranslationState, checkpointer: Option
     if not include_tmx and state.get("tmx_memory"):
         include_tmx = True
     
-    # Create the review graph
-    review_graph = create_review_agent(checkpointer, include_tmx=include_tmx)
+    # Get the review graph - compiled per call only when a checkpointer is given
+    if checkpointer:
+        review_graph = create_review_agent(checkpointer, include_tmx=include_tmx)
+    else:
+        review_graph = _default_review_graph()
     
     # Execute the review workflow
     try:
@@ -126,32 +149,23 @@ def review_translation_multi_agent(state: TranslationState, checkpointer: Option
         }
 
 
-def review_translation_standalone_multi_agent(
+def review_translation_standalone_multi_agent_state(
     original_content: str,
     translated_content: str,
     glossary: dict,
     style_guide: str,
     source_language: str = "English",
     target_language: str = "Spanish"
-) -> tuple[float, str]:
+) -> TranslationState:
     """
-    Standalone function to review a translation using the multi-agent approach.
+    Runs a standalone multi-agent review and returns the full resulting state.
     
-    This allows the multi-agent review system to be called independently
-    from the main translation graph while maintaining the same interface
-    as the original standalone function.
-    
-    Args:
-        original_content: The original text to be translated
-        translated_content: The translated text to be reviewed
-        glossary: Dictionary of term translations
-        style_guide: Style guidelines for the translation
-        source_language: Source language name
-        target_language: Target language name
+    Same inputs as :func:`review_translation_standalone_multi_agent`, but the
+    individual dimension scores and explanations are kept, so callers that
+    need the breakdown do not have to run the review a second time.
     
     Returns:
-        tuple: (score, explanation) where score is float between -1.0 and 1.0
-               and explanation is str (empty if score >= 0.7)
+        TranslationState: Final review state including per-dimension results
     """
     # Create a minimal state dict for the review function
     state_dict: dict = {
@@ -174,8 +188,41 @@ def review_translation_standalone_multi_agent(
         "review_explanation": None
     }
     
+    return cast(TranslationState, review_translation_multi_agent(cast(TranslationState, state_dict)))
+
+
+def review_translation_standalone_multi_agent(
+    original_content: str,
+    translated_content: str,
+    glossary: dict,
+    style_guide: str,
+    source_language: str = "English",
+    target_language: str = "Spanish"
+) -> tuple[float, str]:
+    """
+    Standalone function to review a translation using the multi-agent approach.
+    
+    This allows the multi-agent review system to be called independently
+    from the main translation graph while maintaining the same interface
+    as the original standalone function.
+    
+    Args:
+        original_content: The original text to be translated
+        translated_content: The translated text to be reviewed
+        glossary: Dictionary of term translations
+        style_guide: Style guidelines for the translation
+        source_language: Source language name
+        target_language: Target language name
+    
+    Returns:
+        tuple: (score, explanation) where score is float between -1.0 and 1.0
+               and explanation is str (empty if score >= 0.7)
+    """
     # Call the main multi-agent review function
-    result_ts = cast(TranslationState, review_translation_multi_agent(cast(TranslationState, state_dict)))
+    result_ts = review_translation_standalone_multi_agent_state(
+        original_content, translated_content, glossary, style_guide,
+        source_language, target_language
+    )
     score_raw = result_ts.get("review_score")
     score: float = float(score_raw or 0.0)
     explanation: str = str(result_ts.get("review_explanation", ""))
@@ -187,7 +234,7 @@ if __name__ == "__main__":
     Command-line interface for standalone multi-agent translation review.
     """
     import argparse
-    import csv
+    from nodes.utils import load_glossary_csv
     from dotenv import load_dotenv
     
     load_dotenv()
@@ -213,25 +260,15 @@ if __name__ == "__main__":
             style_guide = f.read().strip()
         
         # Load glossary
-        glossary = {}
-        with open(args.glossary, "r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            if reader.fieldnames and "term" in reader.fieldnames and "translation" in reader.fieldnames:
-                for row in reader:
-                    if row["term"] and row["translation"]:
-                        glossary[row["term"]] = row["translation"]
-            else:
-                f.seek(0)
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 2 and row[0] and row[1]:
-                        glossary[row[0]] = row[1]
+        glossary = load_glossary_csv(args.glossary)
         
-        # Perform multi-agent review
-        score, explanation = review_translation_standalone_multi_agent(
+        # Perform multi-agent review, keeping the full state for the breakdown
+        result = review_translation_standalone_multi_agent_state(
             original, translation, glossary, style_guide,
             args.source_language, args.target_language
         )
+        score = float(result.get("review_score") or 0.0)
+        explanation = str(result.get("review_explanation", ""))
         
         print(f"Multi-Agent Review Score: {score:.2f}")
         if explanation:
@@ -241,27 +278,6 @@ if __name__ == "__main__":
         
         # Show detailed breakdown if requested
         if args.breakdown:
-            state_dict: dict = {
-                "original_content": original,
-                "translated_content": translation,
-                "glossary": glossary,
-                "filtered_glossary": None,
-                "style_guide": style_guide,
-                "source_language": args.source_language,
-                "target_language": args.target_language,
-                "messages": [],
-                "glossary_faithfulness_score": None,
-                "glossary_faithfulness_explanation": None,
-                "grammar_correctness_score": None,
-                "grammar_correctness_explanation": None,
-                "style_adherence_score": None,
-                "style_adherence_explanation": None,
-                "review_score": None,
-                "review_explanation": None
-            }
-            
-            result = cast(TranslationState, review_translation_multi_agent(cast(TranslationState, state_dict)))
-            
             print("\n--- Detailed Score Breakdown ---")
             print(f"Glossary Faithfulness: {result.get('glossary_faithfulness_score', 'N/A')}")
             print(f"Grammar Correctness: {result.get('grammar_correctness_score', 'N/A')}")
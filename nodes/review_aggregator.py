@@ -61,34 +61,35 @@ def aggregate_review_scores(state: TranslationState) -> dict:
     
     # Collect available scores and their weights
     available_scores = {}
+    weighted_sum = 0.0
     total_weight = 0.0
     
     if glossary_score is not None:
         available_scores["glossary_faithfulness"] = glossary_score
+        weighted_sum += glossary_score * DEFAULT_WEIGHTS["glossary_faithfulness"]
         total_weight += DEFAULT_WEIGHTS["glossary_faithfulness"]
         logger.debug(f"Glossary faithfulness score: {glossary_score:.2f}")
     
     if grammar_score is not None:
         available_scores["grammar_correctness"] = grammar_score
+        weighted_sum += grammar_score * DEFAULT_WEIGHTS["grammar_correctness"]
         total_weight += DEFAULT_WEIGHTS["grammar_correctness"]
         logger.debug(f"Grammar correctness score: {grammar_score:.2f}")
     
     if style_score is not None:
         available_scores["style_adherence"] = style_score
+        weighted_sum += style_score * DEFAULT_WEIGHTS["style_adherence"]
         total_weight += DEFAULT_WEIGHTS["style_adherence"]
         logger.debug(f"Style adherence score: {style_score:.2f}")
     
     if tmx_score is not None:
         available_scores["tmx_faithfulness"] = tmx_score
+        weighted_sum += tmx_score * DEFAULT_WEIGHTS["tmx_faithfulness"]
         total_weight += DEFAULT_WEIGHTS["tmx_faithfulness"]
         logger.debug(f"TMX faithfulness score: {tmx_score:.2f}")
     
     # Calculate weighted average if we have any scores
     if available_scores and total_weight > 0:
-        weighted_sum = sum(
-            available_scores[dimension] * DEFAULT_WEIGHTS[dimension]
-            for dimension in available_scores
-        )
         final_score = weighted_sum / total_weight
         
         # Ensure score is within bounds
@@ -98,25 +99,18 @@ def aggregate_review_scores(state: TranslationState) -> dict:
         logger.error("No dimension scores available for aggregation")
         final_score = 0.0
     
-    # Aggregate explanations for scores below the threshold (0.7)
-    explanations = []
-    
-    if glossary_explanation and glossary_score is not None and glossary_score < 0.7:
-        explanations.append(f"Glossary Compliance: {glossary_explanation}")
-    
-    if grammar_explanation and grammar_score is not None and grammar_score < 0.7:
-        explanations.append(f"Grammar Quality: {grammar_explanation}")
-    
-    if style_explanation and style_score is not None and style_score < 0.7:
-        explanations.append(f"Style Adherence: {style_explanation}")
-    
-    if tmx_explanation and tmx_score is not None and tmx_score < 0.7:
-        explanations.append(f"TMX Consistency: {tmx_explanation}")
-    
-    # Combine explanations
-    final_explanation = ""
-    if explanations:
-        final_explanation = " | ".join(explanations)
+    # Aggregate explanations for scores below the threshold (0.7) in one pass
+    dimensions = (
+        ("Glossary Compliance", glossary_score, glossary_explanation),
+        ("Grammar Quality", grammar_score, grammar_explanation),
+        ("Style Adherence", style_score, style_explanation),
+        ("TMX Consistency", tmx_score, tmx_explanation),
+    )
+    final_explanation = " | ".join(
+        f"{label}: {dimension_explanation}"
+        for label, dimension_score, dimension_explanation in dimensions
+        if dimension_explanation and dimension_score is not None and dimension_score < 0.7
+    )
     
     # Add summary if the final score is below threshold but no detailed explanations
     if final_score < 0.7 and not final_explanation:
@@ -15,6 +15,7 @@ Key features:
 
 import logging
 from rapidfuzz import fuzz, process
+from nodes.filter_glossary import find_exact_terms
 from state import TranslationState
 from langgraph.types import Command
 from typing import Literal
@@ -22,7 +23,11 @@ from typing import Literal
 # Configure logging
 logger = logging.getLogger(__name__)
 
-def evaluate_glossary_faithfulness(state: TranslationState) -> Command[Literal["tmx_faithfulness", "grammar_correctness", "aggregator"]]:
+# Grammar and style reviews are independent LLM calls, so they are handed off
+# together and run in the same graph step; both then hand off to the aggregator.
+LLM_REVIEW_NODES = ("grammar_correctness", "style_adherence")
+
+def evaluate_glossary_faithfulness(state: TranslationState) -> Command[Literal["tmx_faithfulness", "grammar_correctness", "style_adherence", "aggregator"]]:
     """
     Evaluates how well the translation adheres to the specified glossary terms.
     
@@ -51,76 +56,89 @@ def evaluate_glossary_faithfulness(state: TranslationState) -> Command[Literal["
             goto="aggregator"
         )
     
-    original_content = state["original_content"].lower()
-    translated_content = state["translated_content"].lower()
+    # Where to continue unless the score is poor enough to skip to the
+    # aggregator: TMX if available, otherwise grammar and style
+    tmx_memory = state.get("tmx_memory")
+    continue_node = "tmx_faithfulness" if (tmx_memory and tmx_memory.get("entries")) else LLM_REVIEW_NODES
     
     # Get the filtered glossary or fall back to the main glossary
     glossary = state.get("filtered_glossary") or state.get("glossary", {})
     
     if not glossary:
         logger.info("No glossary terms to check")
-        # Route to TMX if available, otherwise to grammar
-        next_node = "tmx_faithfulness" if (state.get("tmx_memory") and state["tmx_memory"].get("entries")) else "grammar_correctness"
         return Command(
             update={
                 "glossary_faithfulness_score": 1.0,  # Perfect score if no terms to check
                 "glossary_faithfulness_explanation": ""
             },
-            goto=next_node
+            goto=continue_node
         )
     
-    # Find glossary terms that appear in the original content
+    # Find glossary terms that appear in the original content. The filtered
+    # glossary differs per document, so the matcher is built from the full
+    # glossary (the one filter_glossary compiled) and only the terms under
+    # review are kept; a custom glossary that is not a subset gets its own.
+    full_glossary = state.get("glossary") or {}
+    matcher_glossary = full_glossary if glossary.items() <= full_glossary.items() else glossary
+    found_terms = find_exact_terms(matcher_glossary, state["original_content"].lower())
     relevant_terms = []
     for term, translation in glossary.items():
-        term_lower = term.lower()
-        
-        # Check if the glossary term appears in the original content
-        if term_lower in original_content:
+        if term in found_terms:
             relevant_terms.append((term, translation))
-            logger.debug(f"Found relevant glossary term: {term} -> {translation}")
+            logger.debug("Found relevant glossary term: %s -> %s", term, translation)
     
     if not relevant_terms:
         logger.info("No relevant glossary terms found in original content")
-        # Route to TMX if available, otherwise to grammar
-        next_node = "tmx_faithfulness" if (state.get("tmx_memory") and state["tmx_memory"].get("entries")) else "grammar_correctness"
         return Command(
             update={
                 "glossary_faithfulness_score": 1.0,  # Perfect score if no relevant terms
                 "glossary_faithfulness_explanation": ""
             },
-            goto=next_node
+            goto=continue_node
         )
     
-    # Check each relevant term in the translation
+    # Check each relevant term in the translation. The translation is only
+    # lowercased now that we know there is something to look for.
+    translated_content = state["translated_content"].lower()
     correct_terms = 0
     total_terms = len(relevant_terms)
     missing_terms = []
     incorrect_terms = []
     
+    # Find all expected translations present in the translation in one scan.
+    # Matching against every value of the same (full) glossary as above, not
+    # just the relevant ones, keeps the matcher's cache key stable from one
+    # document to the next.
+    found_translations = find_exact_terms(matcher_glossary.values(), translated_content)
+    
+    unmatched_terms = []
     for term, expected_translation in relevant_terms:
-        expected_lower = expected_translation.lower()
-        
         # Check if the expected translation appears in the translated content
-        if expected_lower in translated_content:
+        if expected_translation in found_translations:
             correct_terms += 1
-            logger.debug(f"Correct glossary usage: {term} -> {expected_translation}")
+            logger.debug("Correct glossary usage: %s -> %s", term, expected_translation)
         else:
-            # Check for fuzzy matches (maybe close but not exact)
-            fuzzy_matches = process.extract(
-                expected_lower,
-                [translated_content],
-                scorer=fuzz.partial_ratio,
-                score_cutoff=75
-            )
-            
-            if fuzzy_matches:
+            unmatched_terms.append((term, expected_translation))
+    
+    if unmatched_terms:
+        # Check for fuzzy matches (maybe close but not exact). All near-misses
+        # are scored in one call, which RapidFuzz spreads across CPU cores.
+        fuzzy_scores = process.cdist(
+            [expected_translation.lower() for _, expected_translation in unmatched_terms],
+            [translated_content],
+            scorer=fuzz.partial_ratio,
+            score_cutoff=75,
+            workers=-1
+        )
+        for (term, expected_translation), (score,) in zip(unmatched_terms, fuzzy_scores):
+            if score:
                 # Found a close match, count as correct but note the variation
                 correct_terms += 1
-                logger.debug(f"Fuzzy match for glossary term: {term} -> {expected_translation}")
+                logger.debug("Fuzzy match for glossary term: %s -> %s", term, expected_translation)
             else:
                 # Term is missing or incorrectly translated
                 missing_terms.append((term, expected_translation))
-                logger.debug(f"Missing/incorrect glossary term: {term} -> {expected_translation}")
+                logger.debug("Missing/incorrect glossary term: %s -> %s", term, expected_translation)
     
     # Calculate the score based on compliance percentage
     compliance_rate = correct_terms / total_terms if total_terms > 0 else 1.0
@@ -150,15 +168,8 @@ def evaluate_glossary_faithfulness(state: TranslationState) -> Command[Literal["
     
     logger.info(f"Glossary faithfulness evaluation complete. Score: {score:.2f}, Compliance: {compliance_rate:.1%}")
     
-    # Determine next node - check for TMX first, then grammar, or skip to aggregator if score is very low
-    if score >= -0.5:
-        # Check if TMX memory is available
-        if state.get("tmx_memory") and state["tmx_memory"].get("entries"):
-            next_node = "tmx_faithfulness"
-        else:
-            next_node = "grammar_correctness"
-    else:
-        next_node = "aggregator"
+    # Determine next node - skip to aggregator if score is very low
+    next_node = continue_node if score >= -0.5 else "aggregator"
     
     return Command(
         update={
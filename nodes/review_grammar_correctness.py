@@ -16,7 +16,6 @@ Key features:
 - Token-efficient evaluation (focused scope)
 """
 
-import json
 import logging
 import os
 from langchain_openai import ChatOpenAI
@@ -24,22 +23,16 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.prompt_values import PromptValue
 from state import TranslationState
 from langgraph.types import Command
-from typing import Literal, Any
-from nodes.utils import extract_response_content
+from typing import Literal
+from nodes.utils import REVIEW_RESPONSE_FORMAT, ReviewParseError, invoke_structured_llm
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Static instructions come first and the per-document text last, so repeated
+# reviews share the longest possible prompt prefix for provider-side caching.
 GRAMMAR_REVIEW_PROMPT = """
-You are a linguistic expert specializing in grammatical analysis. Evaluate ONLY the grammatical correctness of the following translation.
-
----
-**Original Text ({source_language}):**
-{original_content}
-
-**Translation ({target_language}):**
-{translated_content}
----
+You are a linguistic expert specializing in grammatical analysis. Evaluate ONLY the grammatical correctness of the translation given at the end.
 
 Focus exclusively on these grammatical aspects:
 1. **Grammar Rules**: Correct verb conjugations, noun declensions, articles, etc.
@@ -66,9 +59,22 @@ Scoring criteria for grammar only:
 - -1.0 to -0.1: Very poor grammar with major structural problems
 
 Only provide an explanation if the score is below 0.7. Focus on specific grammatical errors and corrections.
+
+---
+**Original Text ({source_language}):**
+{original_content}
+
+**Translation ({target_language}):**
+{translated_content}
+---
 """
 
-def evaluate_grammar_correctness(state: TranslationState) -> Command[Literal["style_adherence", "aggregator"]]:
+# Parsed once; templates are immutable and safe to share between calls.
+# The ChatOpenAI client is still created per call - it already shares
+# langchain-openai's cached HTTP connection pool.
+_GRAMMAR_PROMPT = ChatPromptTemplate.from_template(GRAMMAR_REVIEW_PROMPT)
+
+def evaluate_grammar_correctness(state: TranslationState) -> Command[Literal["aggregator"]]:
     """
     Evaluates the grammatical correctness of the translation using an LLM.
     
@@ -106,8 +112,9 @@ def evaluate_grammar_correctness(state: TranslationState) -> Command[Literal["st
                 goto="aggregator"
             )
         
-        prompt = ChatPromptTemplate.from_template(GRAMMAR_REVIEW_PROMPT)
-        llm = ChatOpenAI(model="gpt-4o", temperature=0)
+        prompt = _GRAMMAR_PROMPT
+        # Grammar checking is well within the smaller model's range; style keeps gpt-4o
+        llm = ChatOpenAI(model="gpt-4o-mini", temperature=0, model_kwargs={"response_format": REVIEW_RESPONSE_FORMAT})
 
         # Prepare the prompt messages
         prompt_messages: PromptValue = prompt.invoke({
@@ -119,62 +126,11 @@ def evaluate_grammar_correctness(state: TranslationState) -> Command[Literal["st
 
         logger.debug("Grammar evaluation prompt prepared, calling LLM...")
 
-        # Handle both real LLM and mock implementations (for testing)
-        if hasattr(llm, "invoke"):
-            response: Any = llm.invoke(prompt_messages)
-        elif hasattr(llm, "__ror__"):
-            # Fallback for mocked implementations in tests
-            chain: Any = llm.__ror__(prompt_messages)  # type: ignore[operator]
-            if hasattr(chain, "invoke"):
-                response = chain.invoke(None)  # type: ignore[assignment]
-            else:
-                raise TypeError(
-                    "Fallback grammar review chain produced by mocked LLM does not "
-                    "expose an 'invoke' method as expected."
-                )
-        else:
-            raise TypeError(
-                "The provided language model must expose either an 'invoke' "
-                "method or support piping via the '|' operator."
-            )
-
-        # Parse the JSON response
         try:
-            response_content = extract_response_content(response).strip()
-            
-            # Handle cases where the LLM wraps the JSON in markdown code blocks
-            if response_content.startswith("```") and response_content.endswith("```"):
-                # Extract content between code blocks
-                lines = response_content.split('\n')
-                # Skip the first line (```json or ```) and the last line (```)
-                response_content = '\n'.join(lines[1:-1])
-            elif response_content.startswith("```json") and response_content.endswith("```"):
-                # Handle ```json specifically
-                response_content = response_content[7:-3].strip()
-            
-            review_data = json.loads(response_content)
-            score = float(review_data.get("score", 0.0))
-            explanation = review_data.get("explanation", "")
-            
-            # Ensure score is within valid range
-            score = max(-1.0, min(1.0, score))
-            
-            logger.info(f"Grammar evaluation complete. Score: {score:.2f}")
-            
-            # Determine next node - skip style if grammar is very poor
-            next_node = "style_adherence" if score >= -0.5 else "aggregator"
-            
-            return Command(
-                update={
-                    "grammar_correctness_score": score,
-                    "grammar_correctness_explanation": explanation
-                },
-                goto=next_node
-            )
-            
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+            score, explanation = invoke_structured_llm(llm, prompt_messages)
+        except ReviewParseError as e:
             logger.error(f"Error parsing grammar review response: {e}")
-            logger.error(f"Raw response: {extract_response_content(response)}")
+            logger.error(f"Raw response: {e.raw_response}")
             return Command(
                 update={
                     "grammar_correctness_score": 0.0,
@@ -182,7 +138,18 @@ def evaluate_grammar_correctness(state: TranslationState) -> Command[Literal["st
                 },
                 goto="aggregator"
             )
-    
+
+        logger.info(f"Grammar evaluation complete. Score: {score:.2f}")
+
+        # Style adherence runs alongside this node, so always hand off to the aggregator
+        return Command(
+            update={
+                "grammar_correctness_score": score,
+                "grammar_correctness_explanation": explanation
+            },
+            goto="aggregator"
+        )
+
     except Exception as e:
         logger.error(f"Error during grammar evaluation: {type(e).__name__}: {str(e)}")
         return Command(
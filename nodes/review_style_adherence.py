@@ -16,7 +16,6 @@ Key features:
 - Token-efficient evaluation (focused scope)
 """
 
-import json
 import logging
 import os
 from langchain_openai import ChatOpenAI
@@ -24,26 +23,17 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.prompt_values import PromptValue
 from state import TranslationState
 from langgraph.types import Command
-from typing import Literal, Any
+from typing import Literal
 from nodes.style_guide import infer_style_guide_from_tmx
-from nodes.utils import extract_response_content
+from nodes.utils import REVIEW_RESPONSE_FORMAT, ReviewParseError, invoke_structured_llm
 
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Ordered from most to least stable: instructions, then the style guide (same
+# for a whole run), then the document pair, to maximise the cacheable prefix.
 STYLE_REVIEW_PROMPT = """
-You are a style and tone expert specializing in translation quality assessment. Evaluate ONLY how well the translation adheres to the specified style guide.
-
----
-**Original Text ({source_language}):**
-{original_content}
-
-**Translation ({target_language}):**
-{translated_content}
-
-**Style Guide:**
-{style_guide}
----
+You are a style and tone expert specializing in translation quality assessment. Evaluate ONLY how well the translation given at the end adheres to the specified style guide.
 
 Focus exclusively on these style aspects:
 1. **Tone and Register**: Does the translation match the required formality level?
@@ -71,8 +61,22 @@ Scoring criteria for style adherence only:
 - -1.0 to -0.1: Very poor style that contradicts the style guide
 
 Only provide an explanation if the score is below 0.7. Focus on specific style violations and recommendations.
+
+---
+**Style Guide:**
+{style_guide}
+
+**Original Text ({source_language}):**
+{original_content}
+
+**Translation ({target_language}):**
+{translated_content}
+---
 """
 
+# Template parsed once at import (see review_grammar_correctness)
+_STYLE_PROMPT = ChatPromptTemplate.from_template(STYLE_REVIEW_PROMPT)
+
 def evaluate_style_adherence(state: TranslationState) -> Command[Literal["aggregator"]]:
     """
     Evaluates how well the translation adheres to the specified style guide.
@@ -131,8 +135,8 @@ def evaluate_style_adherence(state: TranslationState) -> Command[Literal["aggreg
                 goto="aggregator"
             )
         
-        prompt = ChatPromptTemplate.from_template(STYLE_REVIEW_PROMPT)
-        llm = ChatOpenAI(model="gpt-4o", temperature=0)
+        prompt = _STYLE_PROMPT
+        llm = ChatOpenAI(model="gpt-4o", temperature=0, model_kwargs={"response_format": REVIEW_RESPONSE_FORMAT})
 
         # Prepare the prompt messages
         prompt_messages: PromptValue = prompt.invoke({
@@ -145,59 +149,11 @@ def evaluate_style_adherence(state: TranslationState) -> Command[Literal["aggreg
 
         logger.debug("Style evaluation prompt prepared, calling LLM...")
 
-        # Handle both real LLM and mock implementations (for testing)
-        if hasattr(llm, "invoke"):
-            response: Any = llm.invoke(prompt_messages)
-        elif hasattr(llm, "__ror__"):
-            # Fallback for mocked implementations in tests
-            chain: Any = llm.__ror__(prompt_messages)  # type: ignore[operator]
-            if hasattr(chain, "invoke"):
-                response = chain.invoke(None)  # type: ignore[assignment]
-            else:
-                raise TypeError(
-                    "Fallback style review chain produced by mocked LLM does not "
-                    "expose an 'invoke' method as expected."
-                )
-        else:
-            raise TypeError(
-                "The provided language model must expose either an 'invoke' "
-                "method or support piping via the '|' operator."
-            )
-
-        # Parse the JSON response
         try:
-            response_content = extract_response_content(response).strip()
-            
-            # Handle cases where the LLM wraps the JSON in markdown code blocks
-            if response_content.startswith("```") and response_content.endswith("```"):
-                # Extract content between code blocks
-                lines = response_content.split('\n')
-                # Skip the first line (```json or ```) and the last line (```)
-                response_content = '\n'.join(lines[1:-1])
-            elif response_content.startswith("```json") and response_content.endswith("```"):
-                # Handle ```json specifically
-                response_content = response_content[7:-3].strip()
-            
-            review_data = json.loads(response_content)
-            score = float(review_data.get("score", 0.0))
-            explanation = review_data.get("explanation", "")
-            
-            # Ensure score is within valid range
-            score = max(-1.0, min(1.0, score))
-            
-            logger.info(f"Style evaluation complete. Score: {score:.2f}")
-            
-            return Command(
-                update={
-                    "style_adherence_score": score,
-                    "style_adherence_explanation": explanation
-                },
-                goto="aggregator"
-            )
-            
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+            score, explanation = invoke_structured_llm(llm, prompt_messages)
+        except ReviewParseError as e:
             logger.error(f"Error parsing style review response: {e}")
-            logger.error(f"Raw response: {extract_response_content(response)}")
+            logger.error(f"Raw response: {e.raw_response}")
             return Command(
                 update={
                     "style_adherence_score": 0.0,
@@ -205,7 +161,17 @@ def evaluate_style_adherence(state: TranslationState) -> Command[Literal["aggreg
                 },
                 goto="aggregator"
             )
-    
+
+        logger.info(f"Style evaluation complete. Score: {score:.2f}")
+
+        return Command(
+            update={
+                "style_adherence_score": score,
+                "style_adherence_explanation": explanation
+            },
+            goto="aggregator"
+        )
+
     except Exception as e:
         logger.error(f"Error during style evaluation: {type(e).__name__}: {str(e)}")
         return Command(
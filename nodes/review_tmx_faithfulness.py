@@ -29,6 +29,12 @@ from typing import Literal
 # Configure logging
 logger = logging.getLogger(__name__)
 
+
+def _terminal_punctuation(text: str) -> str:
+    """Return the sentence-final '.', '?' or '!' of *text*, or '' if it has none."""
+    last_char = text[-1:]
+    return last_char if last_char and last_char in ".?!" else ""
+
 def evaluate_tmx_faithfulness(state: TranslationState) -> Command[Literal["style_adherence", "aggregator"]]:
     """
     Evaluates how well the translation adheres to TMX translation memory patterns.
@@ -39,6 +45,9 @@ def evaluate_tmx_faithfulness(state: TranslationState) -> Command[Literal["style
     3. Calculates a score based on TMX compliance
     4. Provides detailed explanations for any issues
     
+    When the translation reproduces an exact TMX match, the LLM style review
+    is skipped and style adherence is recorded as 1.0.
+    
     Args:
         state: TranslationState containing translation and TMX memory information
     
@@ -58,14 +67,10 @@ def evaluate_tmx_faithfulness(state: TranslationState) -> Command[Literal["style
             goto="aggregator"
         )
     
-    original_content = state["original_content"]
-    translated_content = state["translated_content"]
-    
-    # Get TMX memory
-    tmx_memory = state.get("tmx_memory", {})
-    
-    if not tmx_memory or "entries" not in tmx_memory:
-        logger.info("No TMX memory available for evaluation")
+    # Missing memory, missing "entries" and an empty list all mean nothing to check
+    tmx_entries = (state.get("tmx_memory") or {}).get("entries") or []
+    if not tmx_entries:
+        logger.info("No TMX entries available for evaluation")
         return Command(
             update={
                 "tmx_faithfulness_score": 1.0,  # Perfect score if no TMX to check
@@ -74,22 +79,17 @@ def evaluate_tmx_faithfulness(state: TranslationState) -> Command[Literal["style
             goto="style_adherence"
         )
     
-    tmx_entries = tmx_memory["entries"]
-    
-    if not tmx_entries:
-        logger.info("No TMX entries available for current language pair")
-        return Command(
-            update={
-                "tmx_faithfulness_score": 1.0,  # Perfect score if no entries
-                "tmx_faithfulness_explanation": ""
-            },
-            goto="style_adherence"
-        )
+    original_content = state["original_content"]
+    translated_content = state["translated_content"]
     
-    # Check for exact matches that should have been used
-    exact_matches = find_tmx_matches(original_content, tmx_entries, threshold=100.0)
+    # One pass over the TMX at the fuzzy threshold; matches come back sorted by
+    # similarity, so the exact ones (that should have been used) lead the list.
+    # Only the best exact match or the top three fuzzy ones are ever inspected.
+    tmx_matches = find_tmx_matches(original_content, tmx_entries, threshold=70.0, limit=3)
+    exact_matches = [match for match in tmx_matches if match["similarity"] >= 100.0]
     score = 1.0
     explanation = ""
+    exact_match_verified = False
     
     if exact_matches:
         # There should be an exact TMX match used
@@ -108,15 +108,17 @@ def evaluate_tmx_faithfulness(state: TranslationState) -> Command[Literal["style
                           f"but got: \"{translated_content}\"")
             logger.warning(f"Exact TMX match not used: expected '{expected_translation}', got '{translated_content}'")
         else:
+            exact_match_verified = True
             logger.info("Translation correctly uses exact TMX match")
     
     else:
         # No exact matches - check for style consistency with similar entries
-        fuzzy_matches = find_tmx_matches(original_content, tmx_entries, threshold=70.0)
+        fuzzy_matches = tmx_matches
         
         if fuzzy_matches:
             # Analyze style consistency
             style_scores = []
+            translated_ending = _terminal_punctuation(translated_content)
             
             for match in fuzzy_matches[:3]:  # Check top 3 matches
                 # Simple style consistency check - could be more sophisticated
@@ -129,10 +131,8 @@ def evaluate_tmx_faithfulness(state: TranslationState) -> Command[Literal["style
                 else:
                     style_scores.append(0.3)
                 
-                # Check punctuation consistency
-                if (translated_content.endswith('.') == tmx_target.endswith('.') and
-                    translated_content.endswith('?') == tmx_target.endswith('?') and
-                    translated_content.endswith('!') == tmx_target.endswith('!')):
+                # Check punctuation consistency (same final '.', '?', '!' or none)
+                if translated_ending == _terminal_punctuation(tmx_target):
                     style_scores.append(0.9)
                 else:
                     style_scores.append(0.5)
@@ -158,6 +158,20 @@ def evaluate_tmx_faithfulness(state: TranslationState) -> Command[Literal["style
     else:
         logger.info(f"TMX faithfulness evaluation complete. Score: {score:.2f} (no issues found)")
     
+    if exact_match_verified:
+        # The translation is a pre-approved TMX target, so an LLM style review
+        # would add cost without adding information
+        logger.info("Skipping style review - exact TMX match verified")
+        return Command(
+            update={
+                "tmx_faithfulness_score": score,
+                "tmx_faithfulness_explanation": explanation,
+                "style_adherence_score": 1.0,
+                "style_adherence_explanation": ""
+            },
+            goto="aggregator"
+        )
+    
     # Determine next node - skip style_adherence if score is very low
     next_node = "style_adherence" if score >= -0.2 else "aggregator"
     
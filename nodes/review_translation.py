@@ -29,8 +29,8 @@ from langchain_core.prompts import ChatPromptTemplate
 from langchain_core.prompt_values import PromptValue
 from state import TranslationState
 from nodes.style_guide import infer_style_guide_from_tmx
-from nodes.utils import extract_response_content
-from typing import Any, cast
+from nodes.utils import REVIEW_RESPONSE_FORMAT, ReviewParseError, invoke_structured_llm
+from typing import cast
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -72,6 +72,9 @@ Scoring criteria:
 Only provide an explanation if the score is below 0.7. The explanation should be constructive and specific about what needs improvement.
 """
 
+# Parsed once at import, like the per-dimension review prompts.
+_REVIEW_PROMPT = ChatPromptTemplate.from_template(REVIEW_PROMPT)
+
 def review_translation(state: TranslationState) -> dict:
     """
     Reviews and grades the translation quality on multiple dimensions.
@@ -102,8 +105,8 @@ def review_translation(state: TranslationState) -> dict:
                 "review_explanation": "ERROR: OpenAI API key not found. Cannot perform automated review."
             }
         
-        prompt = ChatPromptTemplate.from_template(REVIEW_PROMPT)
-        llm = ChatOpenAI(model="gpt-4o", temperature=0)
+        prompt = _REVIEW_PROMPT
+        llm = ChatOpenAI(model="gpt-4o", temperature=0, model_kwargs={"response_format": REVIEW_RESPONSE_FORMAT})
 
         # Get the filtered glossary or fall back to the original glossary
         glossary = state.get("filtered_glossary") or state.get("glossary", {})
@@ -141,60 +144,22 @@ def review_translation(state: TranslationState) -> dict:
 
         logger.debug("Prompt prepared, calling LLM for review...")
 
-        # Handle both real LLM and mock implementations (for testing)
-        if hasattr(llm, "invoke"):
-            response: Any = llm.invoke(prompt_messages)
-        elif hasattr(llm, "__ror__"):
-            # Fallback for mocked implementations in tests
-            chain: Any = llm.__ror__(prompt_messages)  # type: ignore[operator]
-            if hasattr(chain, "invoke"):
-                response = chain.invoke(None)  # type: ignore[assignment]
-            else:
-                raise TypeError(
-                    "Fallback review chain produced by mocked LLM does not "
-                    "expose an 'invoke' method as expected."
-                )
-        else:
-            raise TypeError(
-                "The provided language model must expose either an 'invoke' "
-                "method or support piping via the '|' operator."
-            )
-
-        # Parse the JSON response
         try:
-            response_content = extract_response_content(response).strip()
-            
-            # Handle cases where the LLM wraps the JSON in markdown code blocks
-            if response_content.startswith("```") and response_content.endswith("```"):
-                # Extract content between code blocks
-                lines = response_content.split('\n')
-                # Skip the first line (```json or ```) and the last line (```)
-                response_content = '\n'.join(lines[1:-1])
-            elif response_content.startswith("```json") and response_content.endswith("```"):
-                # Handle ```json specifically
-                response_content = response_content[7:-3].strip()
-            
-            review_data = json.loads(response_content)
-            score = float(review_data.get("score", 0.0))
-            explanation = review_data.get("explanation", "")
-            
-            # Ensure score is within valid range
-            score = max(-1.0, min(1.0, score))
-            
-            logger.info(f"Review complete. Score: {score}")
-            
-            return {
-                "review_score": score,
-                "review_explanation": explanation
-            }
-            
-        except (json.JSONDecodeError, ValueError, KeyError) as e:
+            score, explanation = invoke_structured_llm(llm, prompt_messages)
+        except ReviewParseError as e:
             logger.error(f"Error parsing review response: {e}")
-            logger.error(f"Raw response: {extract_response_content(response)}")
+            logger.error(f"Raw response: {e.raw_response}")
             return {
                 "review_score": 0.0,
                 "review_explanation": f"ERROR: Could not parse review response - {str(e)}"
             }
+        
+        logger.info(f"Review complete. Score: {score}")
+        
+        return {
+            "review_score": score,
+            "review_explanation": explanation
+        }
     
     except Exception as e:
         logger.error(f"Error during translation review: {type(e).__name__}: {str(e)}")
@@ -254,7 +219,7 @@ if __name__ == "__main__":
     Command-line interface for standalone translation review.
     """
     import argparse
-    import csv
+    from nodes.utils import load_glossary_csv
     from dotenv import load_dotenv
     
     load_dotenv()
@@ -279,19 +244,7 @@ if __name__ == "__main__":
             style_guide = f.read().strip()
         
         # Load glossary
-        glossary = {}
-        with open(args.glossary, "r", encoding="utf-8", newline="") as f:
-            reader = csv.DictReader(f)
-            if reader.fieldnames and "term" in reader.fieldnames and "translation" in reader.fieldnames:
-                for row in reader:
-                    if row["term"] and row["translation"]:
-                        glossary[row["term"]] = row["translation"]
-            else:
-                f.seek(0)
-                reader = csv.reader(f)
-                for row in reader:
-                    if len(row) >= 2 and row[0] and row[1]:
-                        glossary[row[0]] = row[1]
+        glossary = load_glossary_csv(args.glossary)
         
         # Perform review
         score, explanation = review_translation_standalone(
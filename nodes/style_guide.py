@@ -7,9 +7,11 @@ parsing concerns now live in *tmx_loader* while stylistic inference lives here.
 """
 from __future__ import annotations
 
+import heapq
 import logging
 import os
 import random
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Tuple
 
 try:
@@ -23,6 +25,37 @@ from langchain_core.prompts import ChatPromptTemplate
 # ---------------------------------------------------------------------------
 logger = logging.getLogger(__name__)
 
+
+STYLE_GUIDE_PROMPT = (
+    "You are a professional localization specialist. Analyse the following "
+    "bilingual examples and produce a detailed, comprehensive style guide covering "
+    "tone, register, punctuation, preferred constructions, formatting conventions, "
+    "voice, and any notable stylistic patterns that will be usable by a human "
+    "translator to guide their work. Focus on guidance applicable to future "
+    "translations of similar content.\n\nExamples:\n{examples}\n\nSTYLE GUIDE:"
+)
+_STYLE_GUIDE_PROMPT = ChatPromptTemplate.from_template(STYLE_GUIDE_PROMPT)
+
+
+@lru_cache(maxsize=1)
+def _get_encoder() -> Any:
+    """Return the GPT-4o tokenizer, resolved once per process."""
+    try:
+        return tiktoken.encoding_for_model("gpt-4o")
+    except Exception:
+        return tiktoken.get_encoding("cl100k_base")
+
+
+@lru_cache(maxsize=1)
+def _prompt_token_count() -> int:
+    """Token count of :data:`STYLE_GUIDE_PROMPT`, which never changes."""
+    return len(_get_encoder().encode(STYLE_GUIDE_PROMPT))
+
+
+def _usage_count(entry: Dict[str, Any]) -> int:
+    """Sort key for TMX entries: how often the segment was used."""
+    return entry.get("usage_count") or 0
+
 # ---------------------------------------------------------------------------
 # PUBLIC API
 # ---------------------------------------------------------------------------
@@ -53,57 +86,56 @@ def infer_style_guide_from_tmx(
     if not tmx_memory or not isinstance(tmx_memory, dict):
         raise ValueError("`tmx_memory` must be a dictionary from load_tmx_memory().")
 
-    entries: List[Dict[str, Any]] | None = tmx_memory.get("entries")  # type: ignore
+    # Malformed (non-dict) entries carry no usable example – skip them once here.
+    entries: List[Dict[str, Any]] = [
+        entry for entry in tmx_memory.get("entries") or [] if isinstance(entry, dict)
+    ]
     if not entries:
         raise ValueError("`tmx_memory` does not contain any translation entries to infer style from.")
 
     # ------------------------------------------------------------------
-    # Sort by usage count so we sample representative, high-quality segments
+    # Drop repeated targets (UI boilerplate such as "OK" or "Cancel") – they
+    # add prompt tokens without adding evidence. The most used one is kept
+    # (the earliest on ties), and entries stay in their original order.
     # ------------------------------------------------------------------
-    try:
-        sorted_entries = sorted(
-            entries,
-            key=lambda e: e.get("usage_count", 0) if isinstance(e, dict) else 0,
-            reverse=True,
-        )
-    except Exception as exc:  # pragma: no cover – pathological data
-        logger.warning("Could not sort TMX entries: %s", exc)
-        sorted_entries = entries
+    best_index: Dict[str, int] = {}
+    for i, entry in enumerate(entries):
+        target = entry.get("target", "")
+        j = best_index.get(target)
+        if j is None or _usage_count(entry) > _usage_count(entries[j]):
+            best_index[target] = i
+    kept = set(best_index.values())
+    unique_entries = [entry for i, entry in enumerate(entries) if i in kept]
+
+    # ------------------------------------------------------------------
+    # Keep the most used entries so we sample representative, high-quality
+    # segments; only max_examples are ever considered.
+    # ------------------------------------------------------------------
+    top_entries = heapq.nlargest(max_examples, unique_entries, key=_usage_count)
 
     # ------------------------------------------------------------------
     # Reservoir sampling constrained by a 120 000-token budget
     # ------------------------------------------------------------------
     TOKEN_BUDGET = 120_000
 
+    examples = [
+        f'- "{entry.get("source", "")}" -> "{entry.get("target", "")}"'
+        for entry in top_entries
+    ]
+
     if tiktoken is not None:
-        try:
-            enc = tiktoken.encoding_for_model("gpt-4o")
-        except Exception:
-            enc = tiktoken.get_encoding("cl100k_base")
-        token_len = lambda s: len(enc.encode(s))  # type: ignore[arg-type]
+        prompt_tokens = _prompt_token_count()
+        # One call tokenises every example on tiktoken's own thread pool
+        example_lens = [len(ids) for ids in _get_encoder().encode_batch(examples)]
     else:
-        token_len = lambda s: max(1, len(s) // 4)
-
-    prompt_stub = (
-        "You are a professional localization specialist. Analyse the following "
-        "bilingual examples and produce a detailed, comprehensive style guide covering "
-        "tone, register, punctuation, preferred constructions, formatting conventions, "
-        "voice, and any notable stylistic patterns that will be usable by a human "
-        "translator to guide their work. Focus on guidance applicable to future "
-        "translations of similar content.\n\nExamples:\n{examples}\n\nSTYLE GUIDE:"
-    )
-    prompt_tokens = token_len(prompt_stub)
+        prompt_tokens = max(1, len(STYLE_GUIDE_PROMPT) // 4)
+        example_lens = [max(1, len(example) // 4) for example in examples]
 
     reservoir: List[Tuple[str, int]] = []
     current_tokens = prompt_tokens
-    processed = 0
 
-    for entry in sorted_entries[:max_examples]:
-        src = entry.get("source", "")
-        tgt = entry.get("target", "")
-        example = f'- "{src}" -> "{tgt}"'
-        t = token_len(example) + 1  # newline
-        processed += 1
+    for processed, (example, example_len) in enumerate(zip(examples, example_lens), start=1):
+        t = example_len + 1  # newline
 
         if t > TOKEN_BUDGET:
             continue
@@ -128,7 +160,7 @@ def infer_style_guide_from_tmx(
     examples_formatted = "\n".join(ex for ex, _ in reservoir)
 
     if use_llm and os.getenv("OPENAI_API_KEY"):
-        prompt = ChatPromptTemplate.from_template(prompt_stub)
+        prompt = _STYLE_GUIDE_PROMPT
         llm = ChatOpenAI(model="gpt-4o", temperature=0)
         messages = prompt.invoke({"examples": examples_formatted})
 
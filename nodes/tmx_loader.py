@@ -21,9 +21,11 @@ The module handles malformed XML gracefully and provides clear error messages.
 
 import logging
 import xml.etree.ElementTree as ET
-from typing import Dict, List, Tuple, Optional, Any
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Dict, FrozenSet, List, Optional, Set, Tuple
 from pathlib import Path
-from rapidfuzz import fuzz
+from rapidfuzz import fuzz, process
 from state import TranslationState
 import os
 from langchain_openai import ChatOpenAI
@@ -37,12 +39,150 @@ except ImportError:  # pragma: no cover
 # Configure logging
 logger = logging.getLogger(__name__)
 
-def parse_tmx_file(tmx_file_path: str) -> Dict[str, List[Dict]]:
+# ElementTree reports ``xml:lang`` under its Clark-notation name
+_XML_LANG = '{http://www.w3.org/XML/1998/namespace}lang'
+
+# How many parsed TMX files (and their canonical indexes) are kept per process
+_TMX_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=512)
+def canonical_language(code: str) -> str:
+    """Return base ISO language code (strip region/script variants).
+
+    Language codes have a tiny cardinality, so results are cached.
+    """
+    return code.lower().partition("-")[0].partition("_")[0]
+
+
+# Canonical-code indexes of recently indexed TMX data, one slot per parsed
+# dictionary (most recently used last). ``parse_tmx_file`` memoizes a separate
+# dictionary per ``wanted_pairs`` filter – e.g. ``load_tmx_memory``'s
+# pair-filtered parse and the unfiltered one used by glossary and style
+# extraction – so each gets its own slot and they do not evict one another.
+# The dictionary itself is kept alongside its indexes so its ``id`` cannot be
+# reused while cached.
+_canonical_index_cache: "OrderedDict[int, Tuple[dict, Dict[Tuple[str, str], List[dict]], Dict[str, List[dict]]]]" = OrderedDict()
+
+
+def canonical_indexes(tmx_data: dict) -> Tuple[Dict[Tuple[str, str], List[dict]], Dict[str, List[dict]]]:
+    """Index TMX entries by canonical ``(source, target)`` pair and by canonical target.
+
+    Built once per TMX dictionary (as returned by :func:`parse_tmx_file`) and
+    reused while it is among the ``_TMX_CACHE_SIZE`` most recently indexed.
+    The returned indexes are shared between callers and must not be mutated.
+    """
+    key = id(tmx_data)
+    cached = _canonical_index_cache.get(key)
+    if cached is not None and cached[0] is tmx_data:
+        _canonical_index_cache.move_to_end(key)
+        return cached[1], cached[2]
+
+    pair_index: Dict[Tuple[str, str], List[dict]] = {}
+    target_index: Dict[str, List[dict]] = {}
+    for pair_key, pair_entries in tmx_data.items():
+        src, sep, tgt = pair_key.partition("->")
+        if sep:
+            pair_index.setdefault((canonical_language(src), canonical_language(tgt)), []).extend(pair_entries)
+        for entry in pair_entries:
+            target_index.setdefault(canonical_language(entry.get("target_lang", "")), []).append(entry)
+
+    _canonical_index_cache[key] = (tmx_data, pair_index, target_index)
+    _canonical_index_cache.move_to_end(key)
+    while len(_canonical_index_cache) > _TMX_CACHE_SIZE:
+        _canonical_index_cache.popitem(last=False)
+    return pair_index, target_index
+
+
+def _add_translation_unit(
+    tu: ET.Element,
+    translation_memory: Dict[str, List[Dict]],
+    wanted_pairs: Optional[FrozenSet[Tuple[str, str]]] = None,
+) -> None:
+    """Add the language-pair combinations of a ``<tu>`` to *translation_memory*.
+
+    When *wanted_pairs* is given, only directions whose canonical
+    ``(source, target)`` codes are in it are stored.
+    """
+    # Extract all translation unit variants (tuvs)
+    tuvs = tu.findall('tuv')
+    
+    if len(tuvs) < 2:
+        logger.debug("Skipping translation unit with less than 2 variants")
+        return
+        
+    # Group TUVs by language
+    lang_segments = {}
+    for tuv in tuvs:
+        lang = tuv.get(_XML_LANG) or tuv.get('xml:lang')
+        if not lang:
+            logger.debug("Skipping TUV without language attribute")
+            continue
+            
+        lang = lang.lower()
+        # Extract the full textual content of the <seg> element *including* any
+        # nested inline tags (e.g. <bpt>, <ept>, <ph>). ``Element.text`` only
+        # captures the text preceding the first child which means segments that
+        # start with markup would be silently ignored.  We therefore join all
+        # pieces produced by ``itertext`` to faithfully reconstruct the full
+        # segment string.
+        seg = tuv.find('seg')
+        if seg is not None:
+            seg_text = "".join(seg.itertext()).strip()
+            if seg_text:
+                lang_segments[lang] = seg_text
+    
+    if len(lang_segments) < 2:
+        return
+    
+    # Unit-level metadata, shared by every pair created below
+    creation_date = tu.get('creationdate', '')
+    usage_count = int(tu.get('usagecount', '0'))
+    
+    # Create translation pairs for all language combinations
+    languages = list(lang_segments.keys())
+    for i, src_lang in enumerate(languages):
+        for tgt_lang in languages[i+1:]:
+            if src_lang != tgt_lang:
+                # Create both directions (src->tgt and tgt->src)
+                for source_lang, target_lang in [(src_lang, tgt_lang), (tgt_lang, src_lang)]:
+                    if wanted_pairs is not None and (canonical_language(source_lang), canonical_language(target_lang)) not in wanted_pairs:
+                        continue
+                    key = f"{source_lang}->{target_lang}"
+                    
+                    if key not in translation_memory:
+                        translation_memory[key] = []
+                    
+                    translation_memory[key].append({
+                        "source": lang_segments[source_lang],
+                        # Normalised once here so matching never re-lowercases
+                        "source_key": lang_segments[source_lang].lower(),
+                        "target": lang_segments[target_lang],
+                        "source_lang": source_lang,
+                        "target_lang": target_lang,
+                        "creation_date": creation_date,
+                        "usage_count": usage_count
+                    })
+
+
+def parse_tmx_file(
+    tmx_file_path: str, wanted_pairs: Optional[Set[Tuple[str, str]]] = None
+) -> Dict[str, List[Dict]]:
     """
     Parses a TMX file and extracts translation memory entries.
     
+    Results are memoized per process, keyed on the absolute path, the file's
+    modification time and size, and *wanted_pairs*, so repeated reads of the
+    same TMX with the same filter only parse it once; a different filter (or
+    none) parses the file again into a separate dictionary. The returned
+    dictionary is shared between callers and must not be mutated.
+    
     Args:
         tmx_file_path: Path to the TMX file
+        wanted_pairs: Canonical ``(source, target)`` codes to keep, e.g.
+            ``{("en", "fr")}``. Other directions are dropped while parsing,
+            which keeps multilingual TMX files from materialising every
+            language combination. All pairs are kept when None.
         
     Returns:
         Dictionary with language pairs as keys and lists of translation units as values.
@@ -50,6 +190,7 @@ def parse_tmx_file(tmx_file_path: str) -> Dict[str, List[Dict]]:
             "en->fr": [
                 {
                     "source": "Hello world", 
+                    "source_key": "hello world",
                     "target": "Bonjour le monde",
                     "source_lang": "en",
                     "target_lang": "fr",
@@ -60,85 +201,69 @@ def parse_tmx_file(tmx_file_path: str) -> Dict[str, List[Dict]]:
             ]
         }
     """
+    try:
+        stat = os.stat(tmx_file_path)
+    except FileNotFoundError:
+        logger.error(f"TMX file not found: {tmx_file_path}")
+        raise FileNotFoundError(f"TMX file not found: {tmx_file_path}")
+
+    return _parse_tmx_file_cached(
+        os.path.abspath(tmx_file_path),
+        stat.st_mtime_ns,
+        stat.st_size,
+        frozenset(wanted_pairs) if wanted_pairs is not None else None,
+    )
+
+
+@lru_cache(maxsize=_TMX_CACHE_SIZE)
+def _parse_tmx_file_cached(
+    tmx_file_path: str,
+    mtime_ns: int,
+    size: int,
+    wanted_pairs: Optional[FrozenSet[Tuple[str, str]]],
+) -> Dict[str, List[Dict]]:
+    """Parse *tmx_file_path*; ``mtime_ns`` and ``size`` only key the cache."""
     logger.info(f"Parsing TMX file: {tmx_file_path}")
     
     try:
-        # Parse the XML file
-        tree = ET.parse(tmx_file_path)
-        root = tree.getroot()
-        
-        # Verify it's a TMX file
-        if root.tag != 'tmx':
-            raise ValueError(f"Invalid TMX file: Root element is '{root.tag}', expected 'tmx'")
+        # Stream the XML so that each <tu> can be discarded as soon as its
+        # pairs have been extracted; only the translation memory itself is
+        # kept in memory.
+        translation_memory = {}
+        open_tags: List[str] = []
+        header_found = False
+        body = None
+        in_body = False
+
+        for event, elem in ET.iterparse(tmx_file_path, events=("start", "end")):
+            if event == "start":
+                # Verify it's a TMX file
+                if not open_tags and elem.tag != 'tmx':
+                    raise ValueError(f"Invalid TMX file: Root element is '{elem.tag}', expected 'tmx'")
+                if len(open_tags) == 1 and elem.tag == 'body' and body is None:
+                    body = elem
+                    in_body = True
+                open_tags.append(elem.tag)
+                continue
+
+            open_tags.pop()
+            if len(open_tags) == 1:
+                if elem.tag == 'header' and not header_found:
+                    # Extract header information
+                    header_found = True
+                    source_lang = elem.get('srclang', '').lower()
+                    logger.debug(f"TMX source language: {source_lang}")
+                elif elem.tag == 'body' and in_body:
+                    in_body = False
+            elif in_body and len(open_tags) == 2 and elem.tag == 'tu':
+                _add_translation_unit(elem, translation_memory, wanted_pairs)
+                # The unit has been consumed; detach it from <body>.
+                body.clear()
         
-        # Extract header information
-        header = root.find('header')
-        if header is None:
+        if not header_found:
             raise ValueError("Invalid TMX file: Missing header element")
-            
-        source_lang = header.get('srclang', '').lower()
-        logger.debug(f"TMX source language: {source_lang}")
-        
-        # Extract translation units from body
-        body = root.find('body')
         if body is None:
             raise ValueError("Invalid TMX file: Missing body element")
-            
-        translation_memory = {}
-        
-        for tu in body.findall('tu'):
-            # Extract all translation unit variants (tuvs)
-            tuvs = tu.findall('tuv')
-            
-            if len(tuvs) < 2:
-                logger.debug("Skipping translation unit with less than 2 variants")
-                continue
-                
-            # Group TUVs by language
-            lang_segments = {}
-            for tuv in tuvs:
-                lang = tuv.get('{http://www.w3.org/XML/1998/namespace}lang') or tuv.get('xml:lang')
-                if not lang:
-                    logger.debug("Skipping TUV without language attribute")
-                    continue
-                    
-                lang = lang.lower()
-                # Extract the full textual content of the <seg> element *including* any
-                # nested inline tags (e.g. <bpt>, <ept>, <ph>). ``Element.text`` only
-                # captures the text preceding the first child which means segments that
-                # start with markup would be silently ignored.  We therefore join all
-                # pieces produced by ``itertext`` to faithfully reconstruct the full
-                # segment string.
-                seg = tuv.find('seg')
-                if seg is not None:
-                    seg_text = "".join(seg.itertext()).strip()
-                    if seg_text:
-                        lang_segments[lang] = seg_text
-            
-            # Create translation pairs for all language combinations
-            languages = list(lang_segments.keys())
-            for i, src_lang in enumerate(languages):
-                for tgt_lang in languages[i+1:]:
-                    if src_lang != tgt_lang:
-                        # Create both directions (src->tgt and tgt->src)
-                        for source_lang, target_lang in [(src_lang, tgt_lang), (tgt_lang, src_lang)]:
-                            key = f"{source_lang}->{target_lang}"
-                            
-                            if key not in translation_memory:
-                                translation_memory[key] = []
-                            
-                            # Extract additional metadata
-                            creation_date = tu.get('creationdate', '')
-                            usage_count = int(tu.get('usagecount', '0'))
-                            
-                            translation_memory[key].append({
-                                "source": lang_segments[source_lang],
-                                "target": lang_segments[target_lang],
-                                "source_lang": source_lang,
-                                "target_lang": target_lang,
-                                "creation_date": creation_date,
-                                "usage_count": usage_count
-                            })
         
         logger.info(f"Successfully parsed TMX file. Found {sum(len(v) for v in translation_memory.values())} translation entries across {len(translation_memory)} language pairs")
         return translation_memory
@@ -154,7 +279,12 @@ def parse_tmx_file(tmx_file_path: str) -> Dict[str, List[Dict]]:
         raise
 
 
-def find_tmx_matches(source_text: str, tmx_entries: List[Dict], threshold: float = 100.0) -> List[Dict]:
+def find_tmx_matches(
+    source_text: str,
+    tmx_entries: List[Dict],
+    threshold: float = 100.0,
+    limit: Optional[int] = None,
+) -> List[Dict]:
     """
     Finds matching translation memory entries for the given source text.
     
@@ -162,6 +292,7 @@ def find_tmx_matches(source_text: str, tmx_entries: List[Dict], threshold: float
         source_text: Text to find matches for
         tmx_entries: List of TMX entries for the language pair
         threshold: Minimum similarity score (0-100) for fuzzy matches
+        limit: Maximum number of matches to return (all matches when None)
         
     Returns:
         List of matching entries sorted by similarity score (highest first)
@@ -170,24 +301,32 @@ def find_tmx_matches(source_text: str, tmx_entries: List[Dict], threshold: float
         return []
     
     source_text = source_text.strip().lower()
-    matches = []
-    
-    for entry in tmx_entries:
-        entry_source = entry["source"].strip().lower()
-        
-        # Calculate similarity score
-        similarity = fuzz.ratio(source_text, entry_source)
-        
-        if similarity >= threshold:
-            match_entry = entry.copy()
-            match_entry["similarity"] = similarity
-            match_entry["match_type"] = "exact" if similarity == 100.0 else "fuzzy"
-            matches.append(match_entry)
+    # Parsed entries carry a normalised "source_key"; hand-built ones may not
+    entry_sources = [
+        entry.get("source_key") or entry["source"].strip().lower() for entry in tmx_entries
+    ]
+    # Score every entry in one rapidfuzz call. The cutoff lets it skip entries
+    # whose length alone rules out reaching the threshold.
+    scored = process.extract(
+        source_text, entry_sources, scorer=fuzz.ratio, score_cutoff=threshold, limit=None
+    )
     
-    # Sort by similarity (highest first), then by usage count
-    matches.sort(key=lambda x: (x["similarity"], x["usage_count"]), reverse=True)
+    # Sort by similarity (highest first), then by usage count, on the
+    # (choice, similarity, index) results; only the returned entries are copied
+    scored.sort(key=lambda r: (r[1], tmx_entries[r[2]]["usage_count"]), reverse=True)
+    matches = [
+        {
+            **tmx_entries[index],
+            "similarity": similarity,
+            "match_type": "exact" if similarity == 100.0 else "fuzzy",
+        }
+        for _, similarity, index in scored[:limit]
+    ]
     
-    logger.debug(f"Found {len(matches)} TMX matches for source text (threshold: {threshold}%)")
+    logger.debug(
+        "Returning %d of %d TMX matches for source text (threshold: %s%%)",
+        len(matches), len(scored), threshold,
+    )
     return matches
 
 
@@ -211,41 +350,29 @@ def load_tmx_memory(state: TranslationState, tmx_file_path: str) -> dict:
             return {"tmx_memory": {}}
         
         # Parse the TMX file
-        full_tmx_memory = parse_tmx_file(tmx_file_path)
-        
         # Extract entries for the current language pair, taking into account
         # potential language-region variants (e.g. "en-US", "fr_FR") that may
         # appear as ``xml:lang`` attributes in multilingual TMX files.
 
-        def _canonical(code: str) -> str:
-            """Return base ISO language code (strip region/script variants)."""
-            return code.lower().split("-")[0].split("_")[0]
-
         source_lang_raw = state["source_language"].lower()
         target_lang_raw = state["target_language"].lower()
 
-        source_base = _canonical(source_lang_raw)
-        target_base = _canonical(target_lang_raw)
+        source_base = canonical_language(source_lang_raw)
+        target_base = canonical_language(target_lang_raw)
+
+        # Only this pair (in any regional variant) is ever used from here on
+        full_tmx_memory = parse_tmx_file(tmx_file_path, wanted_pairs={(source_base, target_base)})
 
         language_pair = f"{source_base}->{target_base}"
 
         # 1. First, try an exact key match (common case when TMX uses plain ISO codes)
         tmx_entries = full_tmx_memory.get(language_pair, [])
 
-        # 2. If nothing found, aggregate over all keys whose canonicalised codes
-        #    match the desired language pair (handles region/script variants).
+        # 2. If nothing found, use every pair whose canonicalised codes match
+        #    the desired language pair (handles region/script variants).
         if not tmx_entries:
-            aggregated: list = []
-            for key, entries in full_tmx_memory.items():
-                try:
-                    src_code, tgt_code = key.split("->", 1)
-                except ValueError:
-                    continue
-
-                if _canonical(src_code) == source_base and _canonical(tgt_code) == target_base:
-                    aggregated.extend(entries)
-
-            tmx_entries = aggregated
+            pair_index, _ = canonical_indexes(full_tmx_memory)
+            tmx_entries = pair_index.get((source_base, target_base), [])
 
         if not tmx_entries:
             logger.info(
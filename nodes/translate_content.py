@@ -71,7 +71,7 @@ def translate_content(state: TranslationState) -> dict:
             tmx_entries = tmx_memory["entries"]
             
             # Look for exact matches (100% similarity)
-            exact_matches = find_tmx_matches(state["original_content"], tmx_entries, threshold=100.0)
+            exact_matches = find_tmx_matches(state["original_content"], tmx_entries, threshold=100.0, limit=1)
             
             if exact_matches:
                 # Use the first exact match (highest usage count)
@@ -1,7 +1,33 @@
 """nodes.utils
 Utility helpers shared across nodes.
 """
-from typing import Any, cast
+import csv
+import json
+import logging
+from itertools import chain
+from typing import Any, Dict, Tuple, cast
+
+logger = logging.getLogger(__name__)
+
+# OpenAI structured-output format for the review nodes. With ``strict`` the
+# API only returns a bare JSON object with exactly these fields, so responses
+# never need markdown-fence stripping or schema checks.
+REVIEW_RESPONSE_FORMAT = {
+    "type": "json_schema",
+    "json_schema": {
+        "name": "review_result",
+        "strict": True,
+        "schema": {
+            "type": "object",
+            "properties": {
+                "score": {"type": "number"},
+                "explanation": {"type": "string"},
+            },
+            "required": ["score", "explanation"],
+            "additionalProperties": False,
+        },
+    },
+}
 
 def extract_response_content(response: Any) -> str:
     """Return the text content of an LLM response object.
@@ -17,4 +43,110 @@ def extract_response_content(response: Any) -> str:
     if hasattr(response, "text"):
         return cast(str, getattr(response, "text"))
     # Fallback – best effort representation
-    return str(response)
\ No newline at end of file
+    return str(response)
+
+
+class ReviewParseError(ValueError):
+    """Raised when a review LLM reply is not the expected JSON object.
+
+    ``raw_response`` keeps the reply text so callers can log it.
+    """
+
+    def __init__(self, message: str, raw_response: str):
+        super().__init__(message)
+        self.raw_response = raw_response
+
+
+def invoke_structured_llm(llm: Any, prompt_messages: Any) -> Tuple[float, str]:
+    """Invoke a review LLM and return its ``(score, explanation)`` pair.
+
+    Real ``ChatOpenAI`` instances are called through ``invoke``; mocked models
+    used in the tests may only support the ``|`` operator, in which case the
+    chain produced by ``__ror__`` is invoked instead.  The score is clamped to
+    ``[-1.0, 1.0]``.
+
+    Raises:
+        TypeError: If *llm* supports neither calling convention.
+        ReviewParseError: If the reply is not a JSON object with a numeric score.
+    """
+    if hasattr(llm, "invoke"):
+        response: Any = llm.invoke(prompt_messages)
+    elif hasattr(llm, "__ror__"):
+        # Fallback for mocked implementations in tests
+        chain: Any = llm.__ror__(prompt_messages)  # type: ignore[operator]
+        if hasattr(chain, "invoke"):
+            response = chain.invoke(None)
+        else:
+            raise TypeError(
+                "Fallback review chain produced by mocked LLM does not "
+                "expose an 'invoke' method as expected."
+            )
+    else:
+        raise TypeError(
+            "The provided language model must expose either an 'invoke' "
+            "method or support piping via the '|' operator."
+        )
+
+    content = extract_response_content(response)
+    try:
+        # Structured outputs guarantee a bare JSON object (see REVIEW_RESPONSE_FORMAT)
+        review_data = json.loads(content)
+        score = float(review_data.get("score", 0.0))
+        explanation = review_data.get("explanation", "")
+    except (json.JSONDecodeError, ValueError, KeyError) as e:
+        raise ReviewParseError(str(e), content) from e
+
+    return max(-1.0, min(1.0, score)), explanation
+
+
+def load_glossary_csv(path: str) -> Dict[str, str]:
+    """Load a ``term → translation`` glossary from a CSV file.
+
+    If the first non-blank row contains ``term`` and ``translation`` columns
+    (in any order) it is used as the header; otherwise the file is treated as
+    headerless with the term in the first column and the translation in the
+    second.  Blank lines are skipped, rows that are too short are skipped with
+    a warning, and rows with an empty term or translation are ignored.  An
+    empty file yields an empty glossary.
+
+    Raises:
+        OSError: If the file cannot be opened (e.g. ``FileNotFoundError``).
+        csv.Error: If the file is not valid CSV.
+    """
+    glossary: Dict[str, str] = {}
+    # A 1 MiB buffer keeps csv's line-by-line reads from issuing many small read() calls
+    with open(path, "r", encoding="utf-8", newline="", buffering=1 << 20) as f:
+        reader = csv.reader(f)
+        # Single pass: the first non-blank row is either the header or, for a
+        # headerless file, already the first glossary entry
+        header = next((row for row in reader if row), None)
+        if header is None:
+            logger.info("Glossary is empty → %s", path)
+            return glossary
+
+        if "term" in header and "translation" in header:
+            term_col, translation_col = header.index("term"), header.index("translation")
+            has_header = True
+        else:
+            term_col, translation_col = 0, 1
+            has_header = False
+        min_len = max(term_col, translation_col) + 1
+
+        rows = ((reader.line_num, row) for row in reader)
+        if not has_header:
+            rows = chain([(reader.line_num, header)], rows)
+        for line_num, row in rows:
+            if not row:
+                continue
+            if len(row) < min_len:
+                logger.warning("Skipping glossary line %d – insufficient columns", line_num)
+            elif row[term_col] and row[translation_col]:
+                glossary[row[term_col]] = row[translation_col]
+
+    logger.info(
+        "Loaded %s glossary (%d terms) → %s",
+        "headered" if has_header else "headerless",
+        len(glossary),
+        path,
+    )
+    return glossary
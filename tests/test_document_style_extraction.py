@@ -35,6 +35,13 @@ class TestSentenceSplitting:
         assert sentences[1] == "This is the second"
         assert sentences[2] == "Is this a question"
 
+    def test_basic_sentence_split_keeps_inline_punctuation(self):
+        """Test that only punctuation followed by whitespace ends a sentence."""
+        text = "Version 2.5 ships today!! See U.S.A. rules...  Done?!\n\nLast one"
+        sentences = _basic_sentence_split(text)
+
+        assert sentences == ["Version 2.5 ships today", "See U.S.A", "rules", "Done", "Last one"]
+
     def test_split_into_sentences_with_nltk(self):
         """Test sentence splitting with NLTK."""
         text = "Dr. Smith went to the U.S.A. He met Mr. Jones. They discussed A.I. technology."
@@ -66,6 +73,42 @@ class TestSentenceSplitting:
             assert sentences[1] == "Sentence two"
             assert sentences[2] == "Sentence three"
 
+    def test_split_into_sentences_without_nltk(self):
+        """Test basic splitting is used when NLTK is not installed."""
+        with patch('nodes.document_parsers._get_nltk', side_effect=ImportError("NLTK is required")):
+            with patch('nodes.document_parsers.sent_tokenize') as mock_tokenize:
+                sentences = split_into_sentences("Sentence one. Sentence two.")
+
+                mock_tokenize.assert_not_called()
+                assert sentences == ["Sentence one", "Sentence two"]
+
+    def test_split_into_sentences_nltk_internal_import_error(self, caplog):
+        """Test ImportErrors raised inside NLTK are reported as failures."""
+        with patch('nodes.document_parsers._get_nltk'):
+            with patch('nodes.document_parsers._ensure_nltk_data'):
+                with patch('nodes.document_parsers.sent_tokenize', side_effect=ImportError("broken punkt")):
+                    with caplog.at_level("WARNING", logger="nodes.document_parsers"):
+                        sentences = split_into_sentences("Sentence one. Sentence two.")
+
+        assert sentences == ["Sentence one", "Sentence two"]
+        assert "NLTK sentence tokenization failed: broken punkt" in caplog.text
+
+    def test_split_into_sentences_checks_nltk_data_once(self):
+        """Test the NLTK data lookup is not repeated for every document."""
+        from nodes.document_parsers import _ensure_nltk_data_once
+
+        _ensure_nltk_data_once.cache_clear()
+        try:
+            with patch('nodes.document_parsers._get_nltk'):
+                with patch('nodes.document_parsers._ensure_nltk_data') as mock_ensure:
+                    with patch('nodes.document_parsers.sent_tokenize', return_value=["One."]):
+                        split_into_sentences("One.")
+                        split_into_sentences("One.", language="german")
+
+            mock_ensure.assert_called_once_with()
+        finally:
+            _ensure_nltk_data_once.cache_clear()
+
     def test_split_empty_text(self):
         """Test splitting empty text."""
         sentences = split_into_sentences("")
@@ -78,7 +121,8 @@ class TestSentenceSplitting:
         """Test NLTK data download with punkt_tab (newer versions)."""
         from nodes.document_parsers import _ensure_nltk_data
         
-        with patch('nodes.document_parsers.nltk') as mock_nltk:
+        with patch('nodes.document_parsers._get_nltk') as mock_get_nltk:
+            mock_nltk = mock_get_nltk.return_value
             # Mock that punkt_tab is found
             mock_nltk.data.find.return_value = True
             
@@ -93,7 +137,8 @@ class TestSentenceSplitting:
         """Test NLTK data download with punkt fallback (older versions)."""
         from nodes.document_parsers import _ensure_nltk_data
         
-        with patch('nodes.document_parsers.nltk') as mock_nltk:
+        with patch('nodes.document_parsers._get_nltk') as mock_get_nltk:
+            mock_nltk = mock_get_nltk.return_value
             # Mock that punkt_tab is not found, but punkt is
             mock_nltk.data.find.side_effect = [
                 LookupError("punkt_tab not found"),  # First call
@@ -111,7 +156,8 @@ class TestSentenceSplitting:
         """Test NLTK data download when neither punkt_tab nor punkt are found."""
         from nodes.document_parsers import _ensure_nltk_data
         
-        with patch('nodes.document_parsers.nltk') as mock_nltk:
+        with patch('nodes.document_parsers._get_nltk') as mock_get_nltk:
+            mock_nltk = mock_get_nltk.return_value
             # Mock that neither punkt_tab nor punkt are found
             mock_nltk.data.find.side_effect = LookupError("not found")
             
@@ -125,7 +171,8 @@ class TestSentenceSplitting:
         """Test NLTK data download fallback when punkt_tab download fails."""
         from nodes.document_parsers import _ensure_nltk_data
         
-        with patch('nodes.document_parsers.nltk') as mock_nltk:
+        with patch('nodes.document_parsers._get_nltk') as mock_get_nltk:
+            mock_nltk = mock_get_nltk.return_value
             # Mock that neither punkt_tab nor punkt are found
             mock_nltk.data.find.side_effect = LookupError("not found")
             # Mock that punkt_tab download fails
@@ -222,14 +269,19 @@ class TestPDFParsing:
 
     def test_parse_pdf_missing_dependency(self):
         """Test PDF parsing without pypdf."""
-        with patch('nodes.document_parsers.pypdf', None):
-            with pytest.raises(ImportError, match="pypdf is required"):
-                from nodes.document_parsers import parse_pdf
-                parse_pdf("test.pdf")
+        from nodes.document_parsers import _get_pypdf, parse_pdf
+
+        _get_pypdf.cache_clear()
+        try:
+            with patch.dict('sys.modules', {'pypdf': None}):
+                with pytest.raises(ImportError, match="pypdf is required"):
+                    parse_pdf("test.pdf")
+        finally:
+            _get_pypdf.cache_clear()
 
     def test_parse_pdf_file_not_found(self):
         """Test PDF parsing with non-existent file."""
-        with patch('nodes.document_parsers.pypdf', MagicMock()):
+        with patch('nodes.document_parsers._get_pypdf', return_value=MagicMock()):
             from nodes.document_parsers import parse_pdf
             
             with pytest.raises(FileNotFoundError):
@@ -242,7 +294,8 @@ class TestPDFParsing:
         mock_page.extract_text.return_value = "This is a sentence. This is another sentence."
         mock_pdf_reader.pages = [mock_page]
         
-        with patch('nodes.document_parsers.pypdf') as mock_pypdf:
+        with patch('nodes.document_parsers._get_pypdf') as mock_get_pypdf:
+            mock_pypdf = mock_get_pypdf.return_value
             mock_pypdf.PdfReader.return_value = mock_pdf_reader
             
             with patch('nodes.document_parsers.split_into_sentences') as mock_split:
@@ -264,7 +317,8 @@ class TestPDFParsing:
         mock_page.extract_text.return_value = ""
         mock_pdf_reader.pages = [mock_page]
         
-        with patch('nodes.document_parsers.pypdf') as mock_pypdf:
+        with patch('nodes.document_parsers._get_pypdf') as mock_get_pypdf:
+            mock_pypdf = mock_get_pypdf.return_value
             mock_pypdf.PdfReader.return_value = mock_pdf_reader
             
             with patch('builtins.open', mock_open()):
@@ -275,19 +329,68 @@ class TestPDFParsing:
                         parse_pdf("test.pdf")
 
 
+    def test_parse_pdf_collapses_whitespace(self):
+        """Whitespace runs collapse and pages join with a single space."""
+        first_page = MagicMock()
+        first_page.extract_text.return_value = "  First\tsentence  here.\n\nSecond   one.\n"
+        second_page = MagicMock()
+        second_page.extract_text.return_value = "\nThird\n\tpage. "
+        mock_pdf_reader = MagicMock()
+        mock_pdf_reader.pages = [first_page, second_page]
+        
+        with patch('nodes.document_parsers._get_pypdf') as mock_get_pypdf:
+            mock_pypdf = mock_get_pypdf.return_value
+            mock_pypdf.PdfReader.return_value = mock_pdf_reader
+            
+            with patch('nodes.document_parsers.split_into_sentences') as mock_split:
+                mock_split.return_value = []
+                
+                with patch('builtins.open', mock_open()):
+                    with patch('pathlib.Path.exists', return_value=True):
+                        from nodes.document_parsers import parse_pdf
+                        
+                        parse_pdf("test.pdf")
+                        
+                        mock_split.assert_called_once_with(
+                            "First sentence here. Second one. Third page.", "english"
+                        )
+
+    def test_parse_pdf_whitespace_only_pages(self):
+        """Pages containing only whitespace count as no content."""
+        mock_page = MagicMock()
+        mock_page.extract_text.return_value = " \n\t \n"
+        mock_pdf_reader = MagicMock()
+        mock_pdf_reader.pages = [mock_page, mock_page]
+        
+        with patch('nodes.document_parsers._get_pypdf') as mock_get_pypdf:
+            mock_pypdf = mock_get_pypdf.return_value
+            mock_pypdf.PdfReader.return_value = mock_pdf_reader
+            
+            with patch('builtins.open', mock_open()):
+                with patch('pathlib.Path.exists', return_value=True):
+                    from nodes.document_parsers import parse_pdf
+                    
+                    with pytest.raises(ValueError, match="No text content found"):
+                        parse_pdf("test.pdf")
+
 class TestDOCXParsing:
     """Tests for DOCX parsing functionality."""
 
     def test_parse_docx_missing_dependency(self):
         """Test DOCX parsing without python-docx."""
-        with patch('nodes.document_parsers.Document', None):
-            with pytest.raises(ImportError, match="python-docx is required"):
-                from nodes.document_parsers import parse_docx
-                parse_docx("test.docx")
+        from nodes.document_parsers import _get_document_class, parse_docx
+
+        _get_document_class.cache_clear()
+        try:
+            with patch.dict('sys.modules', {'docx': None}):
+                with pytest.raises(ImportError, match="python-docx is required"):
+                    parse_docx("test.docx")
+        finally:
+            _get_document_class.cache_clear()
 
     def test_parse_docx_file_not_found(self):
         """Test DOCX parsing with non-existent file."""
-        with patch('nodes.document_parsers.Document', MagicMock()):
+        with patch('nodes.document_parsers._get_document_class', return_value=MagicMock()):
             from nodes.document_parsers import parse_docx
             
             with pytest.raises(FileNotFoundError):
@@ -304,8 +407,8 @@ class TestDOCXParsing:
         mock_doc.paragraphs = [mock_paragraph1, mock_paragraph2]
         mock_doc.tables = []
         
-        with patch('nodes.document_parsers.Document') as mock_document:
-            mock_document.return_value = mock_doc
+        with patch('nodes.document_parsers._get_document_class') as mock_get_document:
+            mock_get_document.return_value.return_value = mock_doc
             
             with patch('nodes.document_parsers.split_into_sentences') as mock_split:
                 mock_split.return_value = ["First paragraph.", "Second paragraph."]
@@ -319,6 +422,60 @@ class TestDOCXParsing:
                     mock_split.assert_called_once()
 
 
+    def test_parse_docx_collapses_whitespace(self):
+        """Paragraphs and table cells join with single spaces."""
+        paragraph1 = MagicMock()
+        paragraph1.text = "First\t\tparagraph.\n"
+        paragraph2 = MagicMock()
+        paragraph2.text = "   "
+        paragraph3 = MagicMock()
+        paragraph3.text = "Second  paragraph."
+        cell1 = MagicMock()
+        cell1.text = " Cell\none. "
+        cell2 = MagicMock()
+        cell2.text = "Cell two."
+        row = MagicMock()
+        row.cells = [cell1, cell2]
+        table = MagicMock()
+        table.rows = [row]
+        
+        mock_doc = MagicMock()
+        mock_doc.paragraphs = [paragraph1, paragraph2, paragraph3]
+        mock_doc.tables = [table]
+        
+        with patch('nodes.document_parsers._get_document_class') as mock_get_document:
+            mock_get_document.return_value.return_value = mock_doc
+            
+            with patch('nodes.document_parsers.split_into_sentences') as mock_split:
+                mock_split.return_value = []
+                
+                with patch('pathlib.Path.exists', return_value=True):
+                    from nodes.document_parsers import parse_docx
+                    
+                    parse_docx("test.docx")
+                    
+                    mock_split.assert_called_once_with(
+                        "First paragraph. Second paragraph. Cell one. Cell two.", "english"
+                    )
+
+    def test_parse_docx_whitespace_only_paragraphs(self):
+        """Paragraphs containing only whitespace count as no content."""
+        paragraph = MagicMock()
+        paragraph.text = " \t\n "
+        
+        mock_doc = MagicMock()
+        mock_doc.paragraphs = [paragraph]
+        mock_doc.tables = []
+        
+        with patch('nodes.document_parsers._get_document_class') as mock_get_document:
+            mock_get_document.return_value.return_value = mock_doc
+            
+            with patch('pathlib.Path.exists', return_value=True):
+                from nodes.document_parsers import parse_docx
+                
+                with pytest.raises(ValueError, match="No text content found"):
+                    parse_docx("test.docx")
+
 class TestStyleExtractionFromDocuments:
     """Tests for style extraction from document files."""
 
@@ -368,7 +525,14 @@ class TestStyleExtractionFromDocuments:
             )
             
             assert result == "TMX style guide"
-            mock_extract.assert_called_once_with("test.tmx", "English", "French", "output.md")
+            mock_extract.assert_called_once_with("test.tmx", "English", "French", "output.md", use_cache=True)
+
+    def test_extract_style_guide_unified_tmx_no_cache(self):
+        """Test that unified TMX extraction passes use_cache through."""
+        with patch('nodes.extract_style.extract_style_guide', return_value="TMX style guide") as mock_extract:
+            extract_style_guide_unified("test.tmx", "tmx", "English", "French", "output.md", use_cache=False)
+
+        mock_extract.assert_called_once_with("test.tmx", "English", "French", "output.md", use_cache=False)
 
     def test_extract_style_guide_unified_tmx_no_target_language(self):
         """Test unified style extraction with TMX but no target language."""
@@ -393,6 +557,168 @@ class TestStyleExtractionFromDocuments:
             extract_style_guide_unified("test.txt", "txt", "English")
 
 
+class TestFlattenTargetSegments:
+    """Tests for selecting TMX entries for style extraction."""
+
+    TMX_DATA = {
+        "en-us->fr-fr": [
+            {"source": "Save", "target": "Enregistrer", "target_lang": "fr-fr"},
+        ],
+        "en-gb->fr-ca": [
+            {"source": "Close", "target": "Fermer", "target_lang": "fr-ca"},
+            {"source": "Empty", "target": "", "target_lang": "fr-ca"},
+        ],
+        "de->fr": [
+            {"source": "Öffnen", "target": "Ouvrir", "target_lang": "fr"},
+        ],
+    }
+
+    def test_exact_key(self):
+        """Test that an exact canonical key is used directly."""
+        from nodes.extract_style import _flatten_target_segments
+
+        tmx_data = {"en->fr": [{"source": "Hi", "target": "Salut"}], **self.TMX_DATA}
+
+        assert _flatten_target_segments(tmx_data, "en", "fr") == [{"source": "Hi", "target": "Salut"}]
+
+    def test_canonical_pair_fallback(self):
+        """Test aggregation over region variants of the requested pair."""
+        from nodes.extract_style import _flatten_target_segments
+
+        entries = _flatten_target_segments(self.TMX_DATA, "en", "fr")
+
+        assert [e["target"] for e in entries] == ["Enregistrer", "Fermer"]
+
+    def test_target_language_fallback(self):
+        """Test that any entry with a matching target is used as a last resort."""
+        from nodes.extract_style import _flatten_target_segments
+
+        entries = _flatten_target_segments(self.TMX_DATA, "it", "fr")
+
+        assert [e["target"] for e in entries] == ["Enregistrer", "Fermer", "Ouvrir"]
+
+    def test_indexes_reused_for_same_tmx_data(self):
+        """Test that canonical indexes are built once per TMX dictionary."""
+        from nodes import extract_style
+
+        from nodes import tmx_loader
+
+        tmx_data = dict(self.TMX_DATA)
+        with patch('nodes.tmx_loader.canonical_language', wraps=tmx_loader.canonical_language) as mock_canonical:
+            extract_style._flatten_target_segments(tmx_data, "en", "fr")
+            calls_after_first = mock_canonical.call_count
+            extract_style._flatten_target_segments(tmx_data, "it", "fr")
+
+        assert calls_after_first > 0
+        assert mock_canonical.call_count == calls_after_first
+
+    def test_indexes_kept_per_tmx_data(self):
+        """Test that indexing a second TMX dictionary does not evict the first."""
+        from nodes import tmx_loader
+
+        first, second = dict(self.TMX_DATA), {"de->it": [{"target": "Apri", "target_lang": "it"}]}
+        first_indexes = tmx_loader.canonical_indexes(first)
+        tmx_loader.canonical_indexes(second)
+
+        with patch('nodes.tmx_loader.canonical_language', wraps=tmx_loader.canonical_language) as mock_canonical:
+            assert tmx_loader.canonical_indexes(first) == first_indexes
+            assert tmx_loader.canonical_indexes(second)[0] == {("de", "it"): second["de->it"]}
+
+        assert mock_canonical.call_count == 0
+
+class TestStyleGuideCache:
+    """Tests for the on-disk cache of TMX style guides."""
+
+    TMX = """<?xml version="1.0" encoding="UTF-8"?>
+    <tmx version="1.4">
+      <header srclang="en" />
+      <body>
+        <tu>
+          <tuv xml:lang="en"><seg>{source}</seg></tuv>
+          <tuv xml:lang="fr"><seg>Bonjour</seg></tuv>
+        </tu>
+      </body>
+    </tmx>"""
+
+    def test_cached_style_guide_reused_until_tmx_changes(self, tmp_path):
+        """Test that an unchanged TMX and language pair skip regeneration."""
+        from nodes.extract_style import extract_style_guide
+
+        tmx_file = tmp_path / "memory.tmx"
+        tmx_file.write_text(self.TMX.format(source="Hello"), encoding="utf-8")
+        output = tmp_path / "style.md"
+
+        with patch('nodes.extract_style.STYLE_CACHE_DIR', tmp_path / "cache"):
+            with patch('nodes.extract_style.infer_style_guide_from_tmx', return_value="# Guide") as mock_infer:
+                first = extract_style_guide(str(tmx_file), "en", "fr", str(output))
+                second = extract_style_guide(str(tmx_file), "en-US", "fr", str(output))
+                assert mock_infer.call_count == 1
+
+                tmx_file.write_text(self.TMX.format(source="Hello there"), encoding="utf-8")
+                extract_style_guide(str(tmx_file), "en", "fr", str(output))
+                assert mock_infer.call_count == 2
+
+        assert first == second == "# Guide"
+        assert output.read_text(encoding="utf-8") == "# Guide"
+
+    def test_cache_disabled(self, tmp_path):
+        """Test that use_cache=False always regenerates and stores nothing."""
+        from nodes.extract_style import extract_style_guide
+
+        tmx_file = tmp_path / "memory.tmx"
+        tmx_file.write_text(self.TMX.format(source="Hello"), encoding="utf-8")
+        cache_dir = tmp_path / "cache"
+
+        with patch('nodes.extract_style.STYLE_CACHE_DIR', cache_dir):
+            with patch('nodes.extract_style.infer_style_guide_from_tmx', return_value="# Guide") as mock_infer:
+                for _ in range(2):
+                    extract_style_guide(str(tmx_file), "en", "fr", str(tmp_path / "style.md"), use_cache=False)
+
+        assert mock_infer.call_count == 2
+        assert not cache_dir.exists()
+
+    def test_cache_dir_env_override(self, tmp_path, monkeypatch):
+        """Test that AI_TRANSLATOR_STYLE_CACHE_DIR relocates the cache."""
+        from nodes.extract_style import extract_style_guide
+
+        tmx_file = tmp_path / "memory.tmx"
+        tmx_file.write_text(self.TMX.format(source="Hello"), encoding="utf-8")
+        monkeypatch.setenv("AI_TRANSLATOR_STYLE_CACHE_DIR", str(tmp_path / "env-cache"))
+
+        with patch('nodes.extract_style.STYLE_CACHE_DIR', tmp_path / "default-cache"):
+            with patch('nodes.extract_style.infer_style_guide_from_tmx', return_value="# Guide"):
+                extract_style_guide(str(tmx_file), "en", "fr", str(tmp_path / "style.md"))
+
+        assert len(list((tmp_path / "env-cache").iterdir())) == 1
+        assert not (tmp_path / "default-cache").exists()
+
+    def test_cache_invalidated_by_version_bump(self, tmp_path):
+        """Test that a new STYLE_CACHE_VERSION does not reuse older guides."""
+        from nodes.extract_style import STYLE_CACHE_VERSION, extract_style_guide
+
+        tmx_file = tmp_path / "memory.tmx"
+        tmx_file.write_text(self.TMX.format(source="Hello"), encoding="utf-8")
+
+        with patch('nodes.extract_style.STYLE_CACHE_DIR', tmp_path / "cache"):
+            with patch('nodes.extract_style.infer_style_guide_from_tmx', side_effect=["# Old", "# New"]):
+                extract_style_guide(str(tmx_file), "en", "fr", str(tmp_path / "style.md"))
+                with patch('nodes.extract_style.STYLE_CACHE_VERSION', STYLE_CACHE_VERSION + 1):
+                    result = extract_style_guide(str(tmx_file), "en", "fr", str(tmp_path / "style.md"))
+
+        assert result == "# New"
+
+    def test_cli_no_cache_flag(self):
+        """Test that extract-style --no-cache disables the cache."""
+        import cli
+
+        argv = ["extract-style", "-i", "m.tmx", "-ft", "tmx",
+                "-sl", "en", "-tl", "fr", "-o", "style.md", "--no-cache"]
+        with patch('cli._setup_logging'), patch('cli.load_dotenv'):
+            with patch('nodes.extract_style.extract_style_guide_unified', return_value="# Guide") as mock_extract:
+                cli.main(argv)
+
+        assert mock_extract.call_args.kwargs["use_cache"] is False
+
 def mock_open(content=""):
     """Helper function to create mock file open."""
     return MagicMock()
@@ -1,5 +1,33 @@
+from types import SimpleNamespace
+from unittest.mock import patch
+
 from nodes.filter_glossary import filter_glossary
 
+
+class StubAutomaton:
+    """Minimal stand-in for ``ahocorasick.Automaton`` (pyahocorasick is optional)."""
+
+    instances = 0
+
+    def __init__(self):
+        StubAutomaton.instances += 1
+        self.words = {}
+
+    def add_word(self, key, value):
+        self.words[key] = value
+
+    def make_automaton(self):
+        pass
+
+    def iter(self, haystack):
+        # Yield (end_index, value) for every occurrence, like pyahocorasick
+        for word, value in self.words.items():
+            start = haystack.find(word)
+            while start != -1:
+                yield start + len(word) - 1, value
+                start = haystack.find(word, start + 1)
+
+
 def test_filter_glossary_finds_terms():
     state = {
         "original_content": "This text talks about Python and LangGraph.",
@@ -63,4 +91,137 @@ def test_filter_glossary_case_insensitive():
     # Should find terms despite case differences
     assert "chaos engineering" in result["filtered_glossary"]
     assert "machine learning" in result["filtered_glossary"]
-    assert "artificial intelligence" not in result["filtered_glossary"] 
\ No newline at end of file
+    assert "artificial intelligence" not in result["filtered_glossary"] 
+
+def test_filter_glossary_overlapping_terms():
+    """Terms that overlap or share a prefix are all found."""
+    state = {
+        "original_content": "The Application Server stack runs chaos engineering drills.",
+        "glossary": {
+            "application": "app",
+            "Application server": "app server",
+            "application server stack": "stack",
+            "chaos": "kaos",
+            "Chaos Engineering": "kaos eng",
+        },
+        "messages": [],
+    }
+    result = filter_glossary(state)
+
+    assert result["filtered_glossary"] == state["glossary"]
+
+
+def test_filter_glossary_without_ahocorasick():
+    """The per-term substring search gives the same result as the automaton."""
+    from nodes.filter_glossary import _build_term_matcher
+
+    state = {
+        "original_content": "We use CHAOS ENGINEERING and Machine Learning in our systems.",
+        "glossary": {
+            "chaos engineering": "chaos testing",
+            "Chaos": "kaos",
+            "machine learning": "ML",
+            "artificial intelligence": "AI",
+        },
+        "messages": [],
+    }
+    _build_term_matcher.cache_clear()
+    StubAutomaton.instances = 0
+    try:
+        with patch("nodes.filter_glossary.ahocorasick", SimpleNamespace(Automaton=StubAutomaton)):
+            expected = filter_glossary(state)["filtered_glossary"]
+        with patch("nodes.filter_glossary.ahocorasick", None):
+            result = filter_glossary(state)
+    finally:
+        _build_term_matcher.cache_clear()
+
+    assert StubAutomaton.instances == 1  # the automaton branch really ran
+    assert result["filtered_glossary"] == expected
+    assert list(expected) == ["chaos engineering", "Chaos", "machine learning"]
+
+
+def test_filter_glossary_fuzzy_fallback_when_nothing_matches_exactly():
+    """Whole-content fuzzy matching is used only when no direct match exists."""
+    state = {
+        "original_content": "The colour palette was updated.",
+        "glossary": {"color": "couleur", "database": "base de données"},
+        "messages": [],
+    }
+    result = filter_glossary(state)
+
+    assert result["filtered_glossary"] == {"color": "couleur"}
+
+
+def test_filter_glossary_fallback_skips_multi_word_terms():
+    """Multi-word terms are not fuzzy-scored a second time in the fallback."""
+    state = {
+        "original_content": "The colour palette was updated.",
+        "glossary": {"color": "couleur", "machine learning": "apprentissage automatique"},
+        "messages": [],
+    }
+    with patch("nodes.filter_glossary.fuzz.partial_ratio", return_value=0) as mock_ratio:
+        filter_glossary(state)
+
+    scored = [call.args[0] for call in mock_ratio.call_args_list]
+    assert scored == ["machine learning", "color"]
+
+
+def test_filter_glossary_reuses_term_matcher():
+    """The term matcher is built once per glossary and reused across runs."""
+    from nodes.filter_glossary import _build_term_matcher
+
+    glossary = {"Python": "Python 3", "python": "py", "LangGraph": "LG"}
+    _build_term_matcher.cache_clear()
+
+    first = filter_glossary({"original_content": "python code", "glossary": glossary, "messages": []})
+    second = filter_glossary({"original_content": "LangGraph code", "glossary": glossary, "messages": []})
+
+    assert first["filtered_glossary"] == {"Python": "Python 3", "python": "py"}
+    assert second["filtered_glossary"] == {"LangGraph": "LG"}
+    assert _build_term_matcher.cache_info().misses == 1
+
+
+def test_glossary_review_reuses_filter_term_matcher():
+    """The glossary review reuses the key matcher compiled by filter_glossary."""
+    from nodes.filter_glossary import _build_term_matcher
+    from nodes.review_glossary_faithfulness import evaluate_glossary_faithfulness
+
+    glossary = {
+        "Chaos Engineering": "Ingeniería del Caos",
+        "database": "base de datos",
+        "cache": "caché",
+    }
+    documents = [
+        ("Chaos Engineering rocks", "La Ingeniería del Caos mola"),
+        ("The database has a cache", "La base de datos tiene una caché"),
+    ]
+    _build_term_matcher.cache_clear()
+
+    results = []
+    for original, translated in documents:
+        filtered = filter_glossary({"original_content": original, "glossary": glossary, "messages": []})
+        builds_after_filter = _build_term_matcher.cache_info().misses
+        results.append(evaluate_glossary_faithfulness({
+            "original_content": original,
+            "translated_content": translated,
+            "glossary": glossary,
+            "filtered_glossary": filtered["filtered_glossary"],
+        }))
+        assert filtered["filtered_glossary"] != glossary
+        # The review matches keys with the filter's matcher; at most the
+        # translation matcher is new
+        assert _build_term_matcher.cache_info().misses <= builds_after_filter + 1
+
+    assert [r.update["glossary_faithfulness_score"] for r in results] == [1.0, 1.0]
+    # One matcher for the glossary keys, one for its translations, shared by
+    # both documents even though their filtered glossaries differ.
+    assert _build_term_matcher.cache_info().misses == 2
+
+
+def test_find_exact_terms_matches_case_insensitively():
+    """find_exact_terms returns every glossary key whose lowercase form occurs."""
+    from nodes.filter_glossary import find_exact_terms
+
+    found = find_exact_terms(["Python", "python", "Rust"], "python and langgraph")
+
+    assert found == {"Python", "python"}
@@ -136,4 +136,43 @@ def test_glossary_loading_handles_japanese_content():
         assert glossary["artificial intelligence"] == "人工知能"
         
     finally:
-        os.unlink(temp_file)
\ No newline at end of file
+        os.unlink(temp_file)
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        pytest.param("term,translation\nhello,こんにちは\nworld,世界\n",
+                     {"hello": "こんにちは", "world": "世界"}, id="headered"),
+        pytest.param("translation,note,term\nこんにちは,greeting,hello\n世界,,world\n",
+                     {"hello": "こんにちは", "world": "世界"}, id="reordered-header"),
+        pytest.param("hello,こんにちは\nincomplete\n,empty_term\nworld,世界\n",
+                     {"hello": "こんにちは", "world": "世界"}, id="headerless"),
+        pytest.param("\nterm,translation\n\nhello,こんにちは\n",
+                     {"hello": "こんにちは"}, id="blank-first-line"),
+        pytest.param("", {}, id="empty-file"),
+    ],
+)
+def test_load_glossary_csv(tmp_path, caplog, content, expected):
+    """The shared loader handles headered, headerless, blank-led and empty files."""
+    from nodes.utils import load_glossary_csv
+
+    path = tmp_path / "glossary.csv"
+    path.write_text(content, encoding="utf-8")
+
+    with caplog.at_level("WARNING", logger="nodes.utils"):
+        glossary = load_glossary_csv(str(path))
+
+    assert glossary == expected
+    warnings = [r.getMessage() for r in caplog.records if r.levelname == "WARNING"]
+    if "incomplete" in content:
+        assert warnings == ["Skipping glossary line 2 – insufficient columns"]
+    else:
+        assert warnings == []
+
+
+def test_load_glossary_csv_missing_file(tmp_path):
+    """A missing glossary raises FileNotFoundError for the caller to report."""
+    from nodes.utils import load_glossary_csv
+
+    with pytest.raises(FileNotFoundError):
+        load_glossary_csv(str(tmp_path / "missing.csv"))
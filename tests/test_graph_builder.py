@@ -0,0 +1,46 @@
+from langgraph.checkpoint.memory import InMemorySaver
+
+from graph import _build_translator_graph, create_translator
+
+
+def test_create_translator_reuses_builder_per_option_combo():
+    """The uncompiled graph is built once per (include_review, include_tmx)."""
+    _build_translator_graph.cache_clear()
+
+    create_translator(checkpointer=InMemorySaver(), include_review=True, include_tmx=False)
+    create_translator(checkpointer=InMemorySaver(), include_review=True, include_tmx=False)
+    create_translator(checkpointer=InMemorySaver(), include_review=False)
+
+    info = _build_translator_graph.cache_info()
+    assert info.misses == 2
+    assert info.hits == 1
+
+
+def test_create_translator_uses_per_run_checkpointer():
+    """Each compiled graph keeps the checkpointer it was created with."""
+    first_saver = InMemorySaver()
+    second_saver = InMemorySaver()
+
+    first = create_translator(checkpointer=first_saver, include_review=True)
+    second = create_translator(checkpointer=second_saver, include_review=True)
+
+    assert first is not second
+    assert first.checkpointer is first_saver
+    assert second.checkpointer is second_saver
+    assert "review" in first.get_graph().nodes
+    assert "review" not in create_translator(checkpointer=InMemorySaver()).get_graph().nodes
+
+
+def test_review_graph_is_compiled_once_without_checkpointer():
+    """Reviews without a checkpointer share one compiled review graph."""
+    from nodes.review_agent import _default_review_graph, review_translation_multi_agent
+
+    _default_review_graph.cache_clear()
+    state = {"original_content": "Hello", "translated_content": None, "glossary": {}, "messages": []}
+
+    review_translation_multi_agent(state)
+    review_translation_multi_agent(state)
+
+    info = _default_review_graph.cache_info()
+    assert info.misses == 1
+    assert info.hits == 1
@@ -10,7 +10,11 @@ from unittest.mock import MagicMock, patch
 from typing import cast
 from types import SimpleNamespace
 
-from nodes.review_agent import review_translation_multi_agent, review_translation_standalone_multi_agent
+from nodes.review_agent import (
+    review_translation_multi_agent,
+    review_translation_standalone_multi_agent,
+    review_translation_standalone_multi_agent_state,
+)
 from nodes.review_glossary_faithfulness import evaluate_glossary_faithfulness
 from nodes.review_grammar_correctness import evaluate_grammar_correctness
 from nodes.review_style_adherence import evaluate_style_adherence
@@ -95,7 +99,7 @@ def test_glossary_faithfulness_perfect_match():
     
     assert result.update["glossary_faithfulness_score"] == 1.0  # Perfect score
     assert result.update["glossary_faithfulness_explanation"] == ""
-    assert result.goto == "grammar_correctness"
+    assert result.goto == ("grammar_correctness", "style_adherence")
 
 
 def test_glossary_faithfulness_no_relevant_terms():
@@ -126,6 +130,44 @@ def test_glossary_faithfulness_no_relevant_terms():
     assert result.update["glossary_faithfulness_explanation"] == ""
 
 
+def test_glossary_faithfulness_only_fuzzy_checks_missing_terms():
+    """Exact translations are found in one scan; only misses are fuzzy-scored."""
+    
+    state = cast(TranslationState, {
+        "original_content": "Chaos Engineering uses a database.",
+        "translated_content": "La ingeniería del caos usa una base de datoz.",
+        "glossary": {"Chaos Engineering": "Ingeniería del Caos", "database": "base de datos"},
+        "filtered_glossary": {"Chaos Engineering": "Ingeniería del Caos", "database": "base de datos"},
+        "messages": [],
+    })
+    
+    with patch("nodes.review_glossary_faithfulness.process.cdist", return_value=[[90.0]]) as mock_cdist:
+        result = evaluate_glossary_faithfulness(state)
+    
+    mock_cdist.assert_called_once()
+    assert mock_cdist.call_args.args == (["base de datos"], [state["translated_content"].lower()])
+    assert result.update["glossary_faithfulness_score"] == 1.0
+
+
+def test_glossary_faithfulness_scores_near_misses_in_one_batch():
+    """Near-miss translations count as correct; absent ones are reported."""
+    
+    state = cast(TranslationState, {
+        "original_content": "Chaos Engineering uses a database.",
+        "translated_content": "La ingenieria del caos usa otra cosa.",
+        "glossary": {"Chaos Engineering": "Ingeniería del Caos", "database": "base de datos"},
+        "filtered_glossary": {"Chaos Engineering": "Ingeniería del Caos", "database": "base de datos"},
+        "messages": [],
+    })
+    
+    result = evaluate_glossary_faithfulness(state)
+    
+    explanation = result.update["glossary_faithfulness_explanation"]
+    assert "'database' (should be 'base de datos')" in explanation
+    assert "Chaos Engineering" not in explanation
+    assert "(1/2 terms correct)" in explanation
+
+
 def test_grammar_correctness_evaluation():
     """Test the grammar correctness evaluation node."""
     
@@ -163,7 +205,7 @@ def test_grammar_correctness_evaluation():
         
         assert result.update["grammar_correctness_score"] == 0.8
         assert result.update["grammar_correctness_explanation"] == ""
-        assert result.goto == "style_adherence"
+        assert result.goto == "aggregator"  # Style adherence runs concurrently
 
 
 def test_style_adherence_evaluation():
@@ -314,6 +356,41 @@ def test_multi_agent_review_integration():
         assert result["review_score"] > 0.8  # Should be high due to good individual scores
 
 
+def test_multi_agent_review_runs_grammar_and_style_concurrently():
+    """Grammar and style reviews run in the same step and overlap in time."""
+    import threading
+    
+    both_started = threading.Barrier(2, timeout=5)
+    
+    class BarrierLLM(MockLLM):
+        def invoke(self, prompt_messages):
+            # Only returns once the other LLM review is in flight as well
+            both_started.wait()
+            return super().invoke(prompt_messages)
+    
+    with patch('os.getenv', return_value="fake-api-key"), \
+         patch('nodes.review_grammar_correctness.ChatOpenAI') as mock_grammar_llm, \
+         patch('nodes.review_style_adherence.ChatOpenAI') as mock_style_llm:
+        
+        mock_grammar_llm.return_value = BarrierLLM(json.dumps({"score": 0.9, "explanation": ""}))
+        mock_style_llm.return_value = BarrierLLM(json.dumps({"score": 0.8, "explanation": ""}))
+        
+        result = review_translation_multi_agent(cast(TranslationState, {
+            "original_content": "Chaos Engineering helps identify failures.",
+            "translated_content": "La Ingeniería del Caos ayuda a identificar fallas.",
+            "style_guide": "formal and professional tone",
+            "source_language": "English",
+            "target_language": "Spanish",
+            "glossary": {"Chaos Engineering": "Ingeniería del Caos"},
+            "filtered_glossary": {"Chaos Engineering": "Ingeniería del Caos"},
+            "messages": [],
+        }))
+    
+    assert result["grammar_correctness_score"] == 0.9
+    assert result["style_adherence_score"] == 0.8
+    assert "ERROR" not in (result["review_explanation"] or "")
+
+
 def test_standalone_multi_agent_review():
     """Test the standalone multi-agent review function."""
     
@@ -345,6 +422,31 @@ def test_standalone_multi_agent_review():
         assert "casual" in explanation
 
 
+def test_standalone_multi_agent_review_state_keeps_breakdown():
+    """The full-state variant exposes every dimension from a single review run."""
+    
+    with patch('os.getenv', return_value="fake-api-key"), \
+         patch('nodes.review_grammar_correctness.ChatOpenAI') as mock_grammar_llm, \
+         patch('nodes.review_style_adherence.ChatOpenAI') as mock_style_llm:
+        
+        mock_grammar_llm.return_value = MockLLM(json.dumps({"score": 0.9, "explanation": ""}))
+        mock_style_llm.return_value = MockLLM(json.dumps({"score": 0.8, "explanation": ""}))
+        
+        result = review_translation_standalone_multi_agent_state(
+            original_content="Chaos Engineering helps.",
+            translated_content="La Ingeniería del Caos ayuda.",
+            glossary={"Chaos Engineering": "Ingeniería del Caos"},
+            style_guide="formal tone",
+        )
+    
+    assert mock_grammar_llm.call_count == 1
+    assert mock_style_llm.call_count == 1
+    assert result["glossary_faithfulness_score"] == 1.0
+    assert result["grammar_correctness_score"] == 0.9
+    assert result["style_adherence_score"] == 0.8
+    assert result["review_score"] is not None
+
+
 def test_error_handling_no_translation():
     """Test error handling when no translated content is available."""
     
@@ -401,4 +503,54 @@ def test_performance_early_termination():
     
     assert result.update["glossary_faithfulness_score"] < -0.5
     # May route directly to aggregator for very poor scores
-    assert result.goto in ["grammar_correctness", "aggregator"]
\ No newline at end of file
+    assert result.goto in ["grammar_correctness", "aggregator"]
+
+def test_review_prompts_put_dynamic_content_last():
+    """Per-document fields follow the static rubric so the prefix is cacheable."""
+    from nodes.review_grammar_correctness import GRAMMAR_REVIEW_PROMPT
+    from nodes.review_style_adherence import STYLE_REVIEW_PROMPT
+    
+    for prompt in (GRAMMAR_REVIEW_PROMPT, STYLE_REVIEW_PROMPT):
+        rubric_end = prompt.index("Only provide an explanation")
+        for field in ("{original_content}", "{translated_content}", "{source_language}", "{target_language}"):
+            assert prompt.index(field) > rubric_end
+    
+    assert STYLE_REVIEW_PROMPT.index("{style_guide}") < STYLE_REVIEW_PROMPT.index("{original_content}")
+
+
+def test_llm_review_nodes_request_structured_output():
+    """Grammar and style reviews ask OpenAI for schema-constrained JSON."""
+    from nodes.utils import REVIEW_RESPONSE_FORMAT
+    
+    state = cast(TranslationState, {
+        "original_content": "Hello",
+        "translated_content": "Hola",
+        "style_guide": "formal tone",
+        "source_language": "English",
+        "target_language": "Spanish",
+        "messages": [],
+    })
+    response = json.dumps({"score": 0.9, "explanation": ""})
+    
+    with patch('os.getenv', return_value="fake-api-key"), \
+         patch('nodes.review_grammar_correctness.ChatOpenAI', return_value=MockLLM(response)) as mock_grammar_llm, \
+         patch('nodes.review_style_adherence.ChatOpenAI', return_value=MockLLM(response)) as mock_style_llm:
+        evaluate_grammar_correctness(state)
+        evaluate_style_adherence(state)
+    
+    for mock_llm in (mock_grammar_llm, mock_style_llm):
+        assert mock_llm.call_args.kwargs["model_kwargs"] == {"response_format": REVIEW_RESPONSE_FORMAT}
+
+
+def test_invoke_structured_llm_clamps_score_and_reports_bad_json():
+    """The shared review helper clamps scores and raises a typed parse error."""
+    from nodes.utils import ReviewParseError, invoke_structured_llm
+    
+    score, explanation = invoke_structured_llm(
+        MockLLM(json.dumps({"score": 3.5, "explanation": "fine"})), None
+    )
+    assert (score, explanation) == (1.0, "fine")
+    
+    with pytest.raises(ReviewParseError) as exc_info:
+        invoke_structured_llm(MockLLM("not json"), None)
+    assert exc_info.value.raw_response == "not json"
@@ -211,6 +211,36 @@ def test_review_translation_invalid_json():
         assert "Could not parse review response" in result["review_explanation"]
 
 
+def test_review_translation_requests_structured_output():
+    """The review asks OpenAI for schema-constrained JSON instead of fenced text."""
+    from nodes.utils import REVIEW_RESPONSE_FORMAT
+    
+    mock_response = json.dumps({"score": 0.8, "explanation": ""})
+    
+    with patch('os.getenv', return_value="fake-api-key"), \
+         patch('nodes.review_translation.ChatOpenAI') as mock_openai:
+        
+        mock_openai.return_value = MockLLM(mock_response)
+        
+        state = cast(TranslationState, {
+            "original_content": "Test",
+            "translated_content": "Prueba",
+            "style_guide": "formal",
+            "source_language": "English",
+            "target_language": "Spanish",
+            "glossary": {},
+            "filtered_glossary": {},
+            "messages": [],
+            "review_score": None,
+            "review_explanation": None
+        })
+        
+        result = review_translation(state)
+        
+        assert result["review_score"] == 0.8
+        assert mock_openai.call_args.kwargs["model_kwargs"] == {"response_format": REVIEW_RESPONSE_FORMAT}
+
+
 def test_review_translation_missing_score():
     """Test behavior when LLM response is missing required fields."""
     
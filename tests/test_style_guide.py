@@ -0,0 +1,108 @@
+"""Tests for TMX-based style guide inference."""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from nodes.style_guide import _get_encoder, _prompt_token_count, infer_style_guide_from_tmx
+
+
+@pytest.fixture(autouse=True)
+def no_tiktoken():
+    """Use the character-based token estimate so no encoding is downloaded."""
+    with patch("nodes.style_guide.tiktoken", None):
+        yield
+
+
+def test_infer_style_guide_without_llm_lists_examples():
+    """Without the LLM the guide is the sampled examples block."""
+    tmx_memory = {
+        "entries": [
+            {"source": "Save", "target": "Enregistrer", "usage_count": 1},
+            {"source": "Close", "target": "Fermer", "usage_count": 5},
+        ]
+    }
+
+    guide = infer_style_guide_from_tmx(tmx_memory, use_llm=False)
+
+    assert guide.startswith("The following examples illustrate tone and syntax.")
+    assert guide.splitlines()[1:] == ['- "Close" -> "Fermer"', '- "Save" -> "Enregistrer"']
+
+
+def test_infer_style_guide_deduplicates_targets():
+    """Repeated targets are sampled once, keeping the most used entry."""
+    tmx_memory = {
+        "entries": [
+            {"source": "Ok", "target": "OK", "usage_count": 1},
+            {"source": "OK", "target": "OK", "usage_count": 9},
+            {"source": "Okay", "target": "OK", "usage_count": 3},
+            {"source": "Cancel", "target": "Annuler", "usage_count": 2},
+        ]
+    }
+
+    guide = infer_style_guide_from_tmx(tmx_memory, use_llm=False)
+
+    assert guide.splitlines()[1:] == ['- "OK" -> "OK"', '- "Cancel" -> "Annuler"']
+
+
+def test_infer_style_guide_ranks_entries_without_usage_count():
+    """Missing or null usage counts rank as zero on the one selection path."""
+    tmx_memory = {
+        "entries": [
+            {"source": "Ok", "target": "OK", "usage_count": None},
+            {"source": "Close", "target": "Fermer"},
+            {"source": "OK", "target": "OK", "usage_count": 4},
+            {"source": "Save", "target": "Enregistrer", "usage_count": 2},
+        ]
+    }
+
+    guide = infer_style_guide_from_tmx(tmx_memory, max_examples=2, use_llm=False)
+
+    assert guide.splitlines()[1:] == ['- "OK" -> "OK"', '- "Save" -> "Enregistrer"']
+
+
+def test_infer_style_guide_skips_non_dict_entries():
+    """Malformed entries are ignored instead of breaking deduplication."""
+    tmx_memory = {
+        "entries": [
+            "stray text",
+            {"source": "Save", "target": "Enregistrer", "usage_count": 2},
+            None,
+        ]
+    }
+
+    guide = infer_style_guide_from_tmx(tmx_memory, use_llm=False)
+
+    assert guide.splitlines()[1:] == ['- "Save" -> "Enregistrer"']
+    with pytest.raises(ValueError, match="does not contain any translation entries"):
+        infer_style_guide_from_tmx({"entries": ["stray text", None]}, use_llm=False)
+
+
+def test_infer_style_guide_requires_entries():
+    """An empty translation memory cannot produce a guide."""
+    with pytest.raises(ValueError, match="does not contain any translation entries"):
+        infer_style_guide_from_tmx({"entries": []}, use_llm=False)
+
+
+def test_infer_style_guide_loads_encoder_once():
+    """The tokenizer is resolved on the first call and reused afterwards."""
+    fake_tiktoken = MagicMock()
+    fake_encoder = fake_tiktoken.encoding_for_model.return_value
+    fake_encoder.encode.side_effect = lambda s: s.split()
+    fake_encoder.encode_batch.side_effect = lambda texts: [t.split() for t in texts]
+    tmx_memory = {"entries": [{"source": "Save", "target": "Enregistrer", "usage_count": 1}]}
+
+    _get_encoder.cache_clear()
+    _prompt_token_count.cache_clear()
+    try:
+        with patch("nodes.style_guide.tiktoken", fake_tiktoken):
+            infer_style_guide_from_tmx(tmx_memory, use_llm=False)
+            infer_style_guide_from_tmx(tmx_memory, use_llm=False)
+    finally:
+        _get_encoder.cache_clear()
+        _prompt_token_count.cache_clear()
+
+    fake_tiktoken.encoding_for_model.assert_called_once_with("gpt-4o")
+    # Examples are tokenised in one batch per call, never one by one
+    assert fake_encoder.encode_batch.call_count == 2
+    fake_encoder.encode.assert_called_once()  # the fixed prompt, counted once
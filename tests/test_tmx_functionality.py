@@ -101,6 +101,23 @@ class TestTMXParsing:
             finally:
                 os.unlink(f.name)
 
+    def test_parse_tmx_missing_header_or_body(self):
+        """Test that TMX files without header or body are rejected"""
+        cases = {
+            '<tmx version="1.4"><body><tu /></body></tmx>': "Missing header element",
+            '<tmx version="1.4"><header srclang="en" /></tmx>': "Missing body element",
+        }
+
+        for content, message in cases.items():
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.tmx', delete=False) as f:
+                f.write(content)
+
+            try:
+                with pytest.raises(ValueError, match=message):
+                    parse_tmx_file(f.name)
+            finally:
+                os.unlink(f.name)
+
     def test_parse_missing_file(self):
         """Test parsing a non-existent file"""
         with pytest.raises(FileNotFoundError):
@@ -128,6 +145,54 @@ class TestTMXParsing:
                 os.unlink(f.name)
 
 
+    def test_parse_tmx_file_is_cached_until_file_changes(self):
+        """Test that repeated parses reuse the result until the file is modified"""
+        tmx_template = """<?xml version="1.0" encoding="UTF-8"?>
+        <tmx version="1.4">
+          <header srclang="en" />
+          <body>
+            <tu>
+              <tuv xml:lang="en"><seg>{source}</seg></tuv>
+              <tuv xml:lang="fr"><seg>Bonjour</seg></tuv>
+            </tu>
+          </body>
+        </tmx>"""
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            tmx_path = Path(tmp_dir) / "memory.tmx"
+            tmx_path.write_text(tmx_template.format(source="Hello"), encoding="utf-8")
+
+            first = parse_tmx_file(str(tmx_path))
+            assert parse_tmx_file(str(tmx_path)) is first
+
+            tmx_path.write_text(tmx_template.format(source="Hello there"), encoding="utf-8")
+            stat = tmx_path.stat()
+            os.utime(tmx_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+            second = parse_tmx_file(str(tmx_path))
+            assert second is not first
+            assert second["en->fr"][0]["source"] == "Hello there"
+
+    def test_parse_tmx_file_keeps_only_wanted_pairs(self, tmp_path):
+        """Test that wanted_pairs drops other directions of multilingual units"""
+        tmx_path = tmp_path / "memory.tmx"
+        tmx_path.write_text("""<?xml version="1.0" encoding="UTF-8"?>
+        <tmx version="1.4">
+          <header srclang="en" />
+          <body>
+            <tu>
+              <tuv xml:lang="en-US"><seg>Hello</seg></tuv>
+              <tuv xml:lang="fr"><seg>Bonjour</seg></tuv>
+              <tuv xml:lang="de"><seg>Hallo</seg></tuv>
+            </tu>
+          </body>
+        </tmx>""", encoding="utf-8")
+
+        assert len(parse_tmx_file(str(tmx_path))) == 6
+        result = parse_tmx_file(str(tmx_path), wanted_pairs={("en", "fr")})
+        assert list(result) == ["en-us->fr"]
+        assert result["en-us->fr"][0]["target"] == "Bonjour"
+
 class TestTMXMatching:
     """Tests for TMX matching functionality"""
 
@@ -191,6 +256,23 @@ class TestTMXMatching:
         matches = find_tmx_matches("Completely different text", tmx_entries, threshold=80.0)
         assert len(matches) == 0
 
+    def test_limit_keeps_best_matches_without_mutating_entries(self):
+        """A limit returns the top matches, usage count breaking similarity ties"""
+        tmx_entries = [
+            {"source": "Hello world", "target": "Salut le monde", "usage_count": 1},
+            {"source": "Hello worlds", "target": "Bonjour les mondes", "usage_count": 9},
+            {"source": "Hello world", "target": "Bonjour le monde", "usage_count": 5},
+        ]
+        
+        with patch('nodes.tmx_loader.logger') as mock_logger:
+            matches = find_tmx_matches("Hello world", tmx_entries, threshold=70.0, limit=2)
+        
+        assert [m["target"] for m in matches] == ["Bonjour le monde", "Salut le monde"]
+        # Both the returned and the candidate counts are logged
+        assert mock_logger.debug.call_args.args[1:3] == (2, 3)
+        assert all(m["match_type"] == "exact" for m in matches)
+        assert "similarity" not in tmx_entries[0]
+
     def test_empty_entries(self):
         """Test handling empty TMX entries"""
         matches = find_tmx_matches("Hello world", [], threshold=100.0)
@@ -239,10 +321,40 @@ class TestTMXLoading:
                 assert len(tmx_memory["entries"]) == 1
                 assert tmx_memory["entries"][0]["source"] == "Hello world"
                 assert tmx_memory["entries"][0]["target"] == "Bonjour le monde"
+                assert tmx_memory["entries"][0]["source_key"] == "hello world"
+                assert find_tmx_matches("HELLO WORLD ", tmx_memory["entries"])[0]["match_type"] == "exact"
                 
             finally:
                 os.unlink(f.name)
 
+    def test_canonical_language_codes(self):
+        """Test that region and script variants reduce to the base language"""
+        from nodes.tmx_loader import canonical_language
+
+        assert canonical_language("en-US") == "en"
+        assert canonical_language("FR_fr") == "fr"
+        assert canonical_language("zh_Hant-TW") == "zh"
+        assert canonical_language("pt-BR_x") == "pt"
+        assert canonical_language("de") == "de"
+        assert canonical_language("") == ""
+
+    def test_load_tmx_memory_merges_region_variants(self, tmp_path):
+        """Test that region-variant pairs are merged when no plain pair exists"""
+        tmx_file = tmp_path / "memory.tmx"
+        tmx_file.write_text("<tmx/>")
+        tmx_data = {
+            "en-us->fr-fr": [{"source": "Save", "target": "Enregistrer"}],
+            "en-us->de-de": [{"source": "Save", "target": "Speichern"}],
+            "en-gb->fr-ca": [{"source": "Close", "target": "Fermer"}],
+        }
+        state = {"source_language": "en-US", "target_language": "fr"}
+        
+        with patch('nodes.tmx_loader.parse_tmx_file', return_value=tmx_data):
+            result = load_tmx_memory(state, str(tmx_file))
+        
+        assert result["tmx_memory"]["language_pair"] == "en->fr"
+        assert [e["target"] for e in result["tmx_memory"]["entries"]] == ["Enregistrer", "Fermer"]
+
     def test_load_nonexistent_tmx_file(self):
         """Test loading a non-existent TMX file"""
         state = {
@@ -256,6 +368,71 @@ class TestTMXLoading:
         assert result["tmx_memory"] == {}
 
 
+class TestTMXGlossaryExtraction:
+    """Tests for glossary extraction from TMX data"""
+
+    def test_collect_entries_exact_key(self):
+        """Test that entries under the exact canonical key are used"""
+        from nodes.extract_glossary import _collect_tmx_entries
+
+        tmx_data = {
+            "en->fr": [{"source": "Hello", "target": "Bonjour"}],
+            "en-US->fr-FR": [{"source": "Cancel", "target": "Annuler"}],
+        }
+
+        assert list(_collect_tmx_entries(tmx_data, "en-US", "fr")) == [("Hello", "Bonjour")]
+
+    def test_collect_entries_canonical_fallback(self):
+        """Test aggregation over regional keys when no exact key exists"""
+        from nodes.extract_glossary import _collect_tmx_entries
+
+        tmx_data = {
+            "en-US->fr-FR": [{"source": "Cancel", "target": "Annuler"}],
+            "en-GB->fr-CA": [{"source": "Save", "target": "Enregistrer"}],
+            "en-US->de-DE": [{"source": "Cancel", "target": "Abbrechen"}],
+        }
+
+        assert list(_collect_tmx_entries(tmx_data, "en", "fr")) == [
+            ("Cancel", "Annuler"),
+            ("Save", "Enregistrer"),
+        ]
+
+    def test_extract_glossary_filters_long_and_duplicate_terms(self):
+        """Test that long segments and case-insensitive duplicates are dropped"""
+        from nodes.extract_glossary import extract_glossary_from_tmx
+
+        tmx_data = {
+            "en->fr": [
+                {"source": "Save", "target": " Enregistrer "},
+                {"source": "save", "target": "sauvegarder"},
+                {"source": "Save the file before closing", "target": "Enregistrez le fichier avant de fermer"},
+            ]
+        }
+
+        with patch('nodes.extract_glossary.parse_tmx_file', return_value=tmx_data), \
+             patch('nodes.extract_glossary.Path.exists', return_value=True):
+            glossary = extract_glossary_from_tmx("memory.tmx", "en", "fr")
+
+        assert glossary == [("Save", "Enregistrer")]
+
+
+    def test_write_glossary_csv(self):
+        """Test that the glossary CSV has a header and quotes embedded commas"""
+        from nodes.extract_glossary import write_glossary_csv
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            out_path = Path(tmp_dir) / "glossary.csv"
+            write_glossary_csv([("Save", "Enregistrer"), ("Save, then close", "Enregistrer, puis fermer")], str(out_path))
+
+            with open(out_path, encoding="utf-8", newline="") as f:
+                content = f.read()
+
+        assert content == (
+            "term,translation\r\n"
+            "Save,Enregistrer\r\n"
+            '"Save, then close","Enregistrer, puis fermer"\r\n'
+        )
+
 class TestTMXTranslationIntegration:
     """Tests for TMX integration with translation functionality"""
 
@@ -365,7 +542,10 @@ class TestTMXReviewIntegration:
         
         assert result.update["tmx_faithfulness_score"] == 1.0
         assert result.update["tmx_faithfulness_explanation"] == ""
-        assert result.goto == "style_adherence"
+        # A verified exact TMX match skips the LLM style review
+        assert result.goto == "aggregator"
+        assert result.update["style_adherence_score"] == 1.0
+        assert result.update["style_adherence_explanation"] == ""
 
     def test_tmx_faithfulness_exact_match_not_used(self):
         """Test TMX faithfulness when exact match is available but not used"""
@@ -391,12 +571,33 @@ class TestTMXReviewIntegration:
         assert "exact TMX match was not used" in result.update["tmx_faithfulness_explanation"]
         assert "Bonjour le monde" in result.update["tmx_faithfulness_explanation"]
 
-    def test_tmx_faithfulness_no_tmx_memory(self):
+    def test_tmx_faithfulness_scans_tmx_once(self):
+        """Exact and fuzzy TMX matches come from a single find_tmx_matches call"""
+        state = {
+            "original_content": "Hello world!",
+            "translated_content": "Bonjour le monde.",
+            "tmx_memory": {
+                "entries": [
+                    {"source": "Hello world", "target": "Bonjour le monde", "usage_count": 5},
+                    {"source": "Unrelated text", "target": "Texte", "usage_count": 1},
+                ]
+            }
+        }
+        
+        with patch('nodes.review_tmx_faithfulness.find_tmx_matches', wraps=find_tmx_matches) as mock_find:
+            result = evaluate_tmx_faithfulness(state)
+        
+        mock_find.assert_called_once()
+        assert result.update["tmx_faithfulness_score"] == 0.7  # Fuzzy-only: partial style match
+        assert result.goto == "style_adherence"
+
+    @pytest.mark.parametrize("tmx_memory", [{}, None, {"entries": []}])
+    def test_tmx_faithfulness_no_tmx_memory(self, tmx_memory):
         """Test TMX faithfulness when no TMX memory is available"""
         state = {
             "original_content": "Hello world",
             "translated_content": "Bonjour le monde",
-            "tmx_memory": {}
+            "tmx_memory": tmx_memory
         }
         
         result = evaluate_tmx_faithfulness(state)